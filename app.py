@@ -1,6 +1,9 @@
 from flask import Flask, render_template, jsonify, request, send_from_directory, send_file
+from flask.json.provider import DefaultJSONProvider
+import atexit
 import json
-import tweepy
+import hashlib
+import orjson
 import os
 import secrets
 from datetime import datetime, timedelta, timezone
@@ -8,9 +11,49 @@ import sqlite3
 import logging
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import closing
+
+# tweepy会连带加载requests/oauthlib等，推迟到创建TwitterAPI时再导入
+tweepy = None
+
+class OrjsonProvider(DefaultJSONProvider):
+    """基于orjson的JSON序列化 - 替换标准库json，加速所有jsonify响应"""
+    option = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=self.option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+# 未配置SECRET_KEY时生成的密钥文件
+SECRET_KEY_FILE = '.secret_key'
+
+def load_secret_key():
+    """读取SECRET_KEY - 未设置环境变量时生成一次并写入文件，所有worker共用"""
+    secret_key = os.environ.get('SECRET_KEY')
+    if secret_key:
+        return secret_key
+
+    if not os.path.exists(SECRET_KEY_FILE):
+        tmp_file = f'{SECRET_KEY_FILE}.{os.getpid()}'
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            f.write(secrets.token_hex(32))
+        try:
+            os.link(tmp_file, SECRET_KEY_FILE)  # 原子创建，多个worker同时启动时只保留第一个
+        except FileExistsError:
+            pass
+        finally:
+            os.remove(tmp_file)
+
+    with open(SECRET_KEY_FILE) as f:
+        return f.read().strip()
 
 app = Flask(__name__)
-app.secret_key = os.environ.get('SECRET_KEY', secrets.token_hex(32))
+app.json = OrjsonProvider(app)
+app.secret_key = load_secret_key()
 
 # 配置日志
 logging.basicConfig(level=logging.INFO)
@@ -23,52 +66,336 @@ print(f"🔑 TWITTER_BEARER_TOKEN: {TWITTER_BEARER_TOKEN[:20] if TWITTER_BEARER_
 # 数据库文件路径
 DB_FILE = 'research_platform.db'
 
+def json_response(payload, status=200):
+    """热点接口直接返回orjson字节，跳过jsonify的str转换（已序列化的bytes原样返回）"""
+    if not isinstance(payload, bytes):
+        payload = orjson.dumps(payload, option=OrjsonProvider.option)
+    return app.response_class(payload, status=status, mimetype='application/json')
+
+def json_body():
+    """用orjson直接解析请求体 - 格式错误或不是JSON对象时返回None"""
+    try:
+        data = orjson.loads(request.get_data() or b'{}')
+    except orjson.JSONDecodeError:
+        return None
+    return data if isinstance(data, dict) else None
+
+class ResponseCache:
+    """进程内TTL缓存 - 保存已序列化的响应体，命中时跳过SQLite和序列化"""
+    def __init__(self, ttl, maxsize=128):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._data.get(key)
+            if item and item[0] > time.monotonic():
+                return item[1]
+            return None
+
+    def set(self, key, value):
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.maxsize:
+                self._data.clear()
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+class TokenBucket:
+    """令牌桶限流 - 额度充足时立即放行，耗尽后按补充速率等待"""
+    def __init__(self, capacity, period):
+        self.capacity = capacity
+        self.rate = capacity / period  # 每秒补充的令牌数
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """取一个令牌，必要时等待，返回等待的秒数"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # 先预占令牌再在锁外等待，并发调用按顺序排队
+            wait_seconds = max(1 - self._tokens, 0) / self.rate
+            self._tokens -= 1
+
+        if wait_seconds > 0:
+            time.sleep(wait_seconds)
+        return wait_seconds
+
+# 分析数据每个监控周期才变化一次；研究者列表仅缓存无搜索条件的分页
+analytics_cache = ResponseCache(ttl=60, maxsize=1)
+researchers_cache = ResponseCache(ttl=60, maxsize=256)
+# 系统状态面板高频轮询，短时间内的重复请求直接返回
+status_cache = ResponseCache(ttl=5, maxsize=1)
+
+def invalidate_caches():
+    """数据写入后清空响应缓存"""
+    analytics_cache.clear()
+    researchers_cache.clear()
+    status_cache.clear()
+
+def connect_db():
+    """创建SQLite连接并应用统一的PRAGMA设置"""
+    # 长连接上的SQL文本固定，加大语句缓存（默认128）使各接口的语句都只解析一次
+    conn = sqlite3.connect(DB_FILE, check_same_thread=False, cached_statements=256)
+    conn.row_factory = sqlite3.Row
+    conn.execute('PRAGMA journal_mode=WAL;')
+    conn.execute('PRAGMA synchronous=NORMAL;')
+    conn.execute('PRAGMA temp_store=MEMORY;')
+    conn.execute('PRAGMA cache_size=-65536;')  # 约64MB页缓存
+    conn.execute('PRAGMA mmap_size=268435456;')  # 256MB内存映射，读取直接命中OS页缓存
+    conn.execute('PRAGMA busy_timeout=5000;')  # 监控线程写入时读请求等待而非报错
+    conn.execute('PRAGMA foreign_keys=ON;')
+    return conn
+
+# 每个线程持有一个长连接，跨请求保留页缓存和语句缓存
+db_local = threading.local()
+
+def get_db():
+    """获取当前线程的数据库连接 - 首次使用时创建"""
+    db = getattr(db_local, 'conn', None)
+    if db is None:
+        db = db_local.conn = connect_db()
+        db_local.requests = 0
+    return db
+
+@app.teardown_appcontext
+def release_db(exception):
+    """请求结束时回滚未提交的事务，连接留给本线程复用"""
+    db = getattr(db_local, 'conn', None)
+    if db is None:
+        return
+
+    if db.in_transaction:
+        db.rollback()
+
+    # 每500次请求按需更新一次统计信息
+    db_local.requests += 1
+    if db_local.requests % 500 == 0:
+        db.execute('PRAGMA optimize;')
+
+# 接口返回的研究者字段 - 显式列出，避免依赖表结构中的列顺序
+RESEARCHER_COLUMNS = '''id, rank, name, country, company, research_focus, x_account,
+    followers_count, following_count, avatar_url, is_monitoring, is_special_focus'''
+
+def researcher_dict(row):
+    """sqlite3.Row转为字典，布尔标记转换为bool"""
+    researcher = dict(row)
+    researcher['is_monitoring'] = bool(researcher['is_monitoring'])
+    researcher['is_special_focus'] = bool(researcher['is_special_focus'])
+    researcher.pop('total_count', None)  # 搜索查询附带的窗口计数列
+    return researcher
+
+# 高频轮询的状态接口共用按秒缓存的时间戳；整体替换元组，多线程读取无需加锁
+iso_now_cache = (0, '')
+
+def iso_now():
+    """当前本地时间的ISO字符串 - 精确到秒，每秒只格式化一次"""
+    global iso_now_cache
+    second = int(time.time())
+    cached_second, cached_text = iso_now_cache
+    if second != cached_second:
+        cached_text = datetime.fromtimestamp(second).isoformat()
+        iso_now_cache = (second, cached_text)
+    return cached_text
+
 def format_interval(seconds):
     """将秒数格式化为人性化的时间显示"""
     if seconds < 3600:
         return f"{seconds // 60}分钟"
-    elif seconds < 86400:
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        if minutes == 0:
-            return f"{hours}小时"
-        else:
-            return f"{hours}小时{minutes}分钟"
-    else:
-        days = seconds // 86400
-        hours = (seconds % 86400) // 3600
-        if hours == 0:
-            return f"{days}天"
-        else:
-            return f"{days}天{hours}小时"
+
+    if seconds < 86400:
+        hours, remainder = divmod(seconds, 3600)
+        minutes = remainder // 60
+        return f"{hours}小时{minutes}分钟" if minutes else f"{hours}小时"
+
+    days, remainder = divmod(seconds, 86400)
+    hours = remainder // 3600
+    return f"{days}天{hours}小时" if hours else f"{days}天"
+
+# 关注数展示后缀 - 旧数据以'127K'形式存储
+COUNT_SUFFIXES = {'K': 1_000, 'M': 1_000_000, 'B': 1_000_000_000}
+
+def parse_count(value):
+    """将'127K'/'1.2M'/'1,234'等格式解析为整数，无法解析时返回0"""
+    if isinstance(value, (int, float)):
+        return int(value)
+    text = str(value or '').strip().upper().replace(',', '')
+    multiplier = COUNT_SUFFIXES.get(text[-1:], 1)
+    if multiplier != 1:
+        text = text[:-1]
+    try:
+        return round(float(text) * multiplier)
+    except ValueError:
+        return 0
+
+# 研究者表结构 - 建表与旧库迁移共用
+RESEARCHERS_SCHEMA = '''
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    rank INTEGER,
+    name TEXT NOT NULL,
+    country TEXT,
+    company TEXT,
+    research_focus TEXT,
+    x_account TEXT,
+    followers_count INTEGER DEFAULT 0,
+    following_count INTEGER DEFAULT 0,
+    avatar_url TEXT DEFAULT '',
+    is_monitoring BOOLEAN DEFAULT 0,
+    is_special_focus BOOLEAN DEFAULT 0,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    twitter_user_id TEXT
+'''
+
+# 写入语句 - 模块级常量，SQL文本固定以便命中连接的语句缓存
+UPSERT_RESEARCHER_SQL = '''
+    INSERT OR REPLACE INTO researchers
+    (rank, name, country, company, research_focus, x_account)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+
+# 多行VALUES插入 - 6列×166行=996个参数，低于旧版SQLite的999个变量上限
+RESEARCHER_ROWS_PER_STATEMENT = 166
+
+def upsert_researchers_sql(row_count):
+    """生成一次插入多行研究者的语句；整块的SQL文本相同，可命中语句缓存"""
+    return f'''
+    INSERT OR REPLACE INTO researchers
+    (rank, name, country, company, research_focus, x_account)
+    VALUES {', '.join(['(?, ?, ?, ?, ?, ?)'] * row_count)}
+'''
+
+INSERT_SAMPLE_RESEARCHER_SQL = '''
+    INSERT OR IGNORE INTO researchers
+    (rank, name, country, company, research_focus, x_account, followers_count, following_count)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+INSERT_CONTENT_SQL = '''
+    INSERT OR IGNORE INTO x_content
+    (researcher_id, tweet_id, content, likes_count, retweets_count, replies_count, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+
+# 监控热路径语句 - 定义为常量，每批复用同一SQL文本命中语句缓存
+SELECT_DUE_RESEARCHERS_SQL = '''
+    SELECT r.id, r.name, r.x_account, r.twitter_user_id FROM researchers r
+    LEFT JOIN monitoring_tasks mt ON mt.researcher_id = r.id
+    WHERE r.is_monitoring = 1
+      AND (mt.next_check_at IS NULL OR mt.next_check_at <= datetime('now'))
+    ORDER BY mt.next_check_at
+    LIMIT ?
+'''
+
+UPDATE_TWITTER_USER_ID_SQL = 'UPDATE researchers SET twitter_user_id = ? WHERE id = ?'
+
+SCHEDULE_MONITORING_TASK_SQL = '''
+    INSERT INTO monitoring_tasks (researcher_id, last_check, next_check_at)
+    VALUES (?, CURRENT_TIMESTAMP, datetime('now', ?))
+    ON CONFLICT(researcher_id) DO UPDATE SET
+        last_check = excluded.last_check, next_check_at = excluded.next_check_at
+'''
+
+# 研究者二级索引 - 大批量导入时先删除，导入完成后一次性重建
+RESEARCHER_INDEXES = {
+    'idx_researchers_rank': 'researchers(rank)',
+    'idx_researchers_name': 'researchers(name)',
+    # 部分索引只包含特别关注的研究者，按姓名排序的列表直接按索引顺序读取
+    'idx_researchers_special_name': 'researchers(name) WHERE is_special_focus = 1',
+    'idx_researchers_account': 'researchers(x_account)',
+    # 覆盖索引 - 分析页的国家/公司分布按索引顺序分组，无需临时排序
+    'idx_researchers_country': 'researchers(country)',
+    'idx_researchers_company': 'researchers(company)',
+}
+
+# 超过该行数的导入才值得重建索引
+BULK_IMPORT_MIN_ROWS = 10000
+
+def drop_researcher_indexes(cursor):
+    """删除研究者二级索引，避免导入时逐行维护"""
+    for name in RESEARCHER_INDEXES:
+        cursor.execute(f'DROP INDEX IF EXISTS {name};')
+
+def create_researcher_indexes(cursor):
+    """创建研究者二级索引"""
+    for name, target in RESEARCHER_INDEXES.items():
+        cursor.execute(f'CREATE INDEX IF NOT EXISTS {name} ON {target};')
 
 def insert_researcher_batch(cursor, batch_data, error_details):
-    """批量插入研究者数据"""
+    """批量插入研究者数据 - 多行VALUES分块插入，失败时回退逐行插入以定位错误"""
+    cursor.execute('SAVEPOINT researcher_batch')
+    try:
+        for start in range(0, len(batch_data), RESEARCHER_ROWS_PER_STATEMENT):
+            chunk = batch_data[start:start + RESEARCHER_ROWS_PER_STATEMENT]
+            cursor.execute(upsert_researchers_sql(len(chunk)), [value for row in chunk for value in row])
+        cursor.execute('RELEASE researcher_batch')
+        return len(batch_data)
+    except Exception:
+        # 撤销本批已写入的部分，逐行重试以收集错误详情
+        cursor.execute('ROLLBACK TO researcher_batch')
+        cursor.execute('RELEASE researcher_batch')
+
     added_count = 0
+    failed_rows = []
 
     for data in batch_data:
         try:
-            cursor.execute('''
-                INSERT OR REPLACE INTO researchers
-                (rank, name, country, company, research_focus, x_account)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', data)
+            cursor.execute(UPSERT_RESEARCHER_SQL, data)
             added_count += 1
 
         except Exception as e:
-            error_msg = f"插入数据失败 {data[1]}: {str(e)}"
-            error_details.append(error_msg)
-            logger.error(error_msg)
+            failed_rows.append((data[1], e))
+
+    # 错误汇总后统一记录，整批只写一次日志
+    if failed_rows:
+        error_details.extend(f"插入数据失败 {name}: {str(e)}" for name, e in failed_rows)
+        logger.error(f"❌ 本批 {len(failed_rows)} 行插入失败，首个错误: {error_details[-len(failed_rows)]}")
 
     return added_count
 
+def tweet_rows(researcher_id, tweets):
+    """将推文列表转换为x_content插入参数"""
+    return [
+        (
+            researcher_id, tweet['id'], tweet['content'],
+            tweet['likes'], tweet['retweets'], tweet['replies'],
+            tweet['created_at']
+        ) for tweet in tweets
+    ]
+
+def insert_content_batch(cursor, content_rows):
+    """批量插入推文内容，返回新增条数"""
+    if not content_rows:
+        return 0
+
+    cursor.executemany(INSERT_CONTENT_SQL, content_rows)
+    return cursor.rowcount
+
+# 用户信息接口请求的字段
+USER_INFO_FIELDS = ['public_metrics', 'profile_image_url', 'description', 'verified']
+
 # 优化的TwitterAPI类 - 修复重复路由和API限制问题
 class TwitterAPI:
     def __init__(self):
+        global tweepy
+        import tweepy
+
         self.client = None
         self.api_working = False
         self.connection_tested = False
         self.rate_limit_hit = False
+        self.rate_limit_reset = 0  # API限制解除时间（epoch秒）
+        self.rate_limit_strikes = 0  # 连续遇到限制的次数，用于指数退避
+        self.user_ids = {}  # 用户名(小写) -> 用户ID，避免每次拉取推文都先查询用户
+        self.tweets_cache = ResponseCache(ttl=60, maxsize=1024)  # 短时间内重复拉取同一用户时直接返回
+        self.user_lookup_limiter = TokenBucket(capacity=300, period=900)  # 用户名查询接口每15分钟300次
 
         # 获取Bearer Token
         bearer_token = os.environ.get('TWITTER_BEARER_TOKEN')
@@ -110,7 +437,7 @@ class TwitterAPI:
             return False
 
         # 如果之前已经遇到rate limit，暂时跳过测试
-        if self.rate_limit_hit:
+        if self.is_rate_limited():
             logger.warning("⚠️ 之前遇到API限制，跳过连接测试")
             return False
 
@@ -136,8 +463,7 @@ class TwitterAPI:
                 return False
 
         except tweepy.TooManyRequests as e:
-            logger.warning(f"⚠️ API限制: {e}")
-            self.rate_limit_hit = True
+            self._handle_rate_limit(e)
             # 设置一个标志表示API目前不可用，但客户端配置正确
             self.api_working = False
             return False
@@ -154,13 +480,116 @@ class TwitterAPI:
             logger.error(f"❌ 未知错误: {type(e).__name__}: {e}")
             return False
 
+    def _handle_rate_limit(self, e):
+        """记录API限制 - 优先使用响应头中的重置时间，否则指数退避"""
+        self.rate_limit_strikes += 1
+        reset_at = time.time() + min(60 * 2 ** (self.rate_limit_strikes - 1), 900)
+
+        response = getattr(e, 'response', None)
+        if response is not None:
+            try:
+                reset_at = int(response.headers['x-rate-limit-reset'])
+            except (KeyError, TypeError, ValueError):
+                pass
+
+        self.rate_limit_hit = True
+        self.rate_limit_reset = reset_at
+        logger.warning(f"⚠️ API限制: {e}，约 {max(int(reset_at - time.time()), 0)} 秒后恢复")
+
+    def is_rate_limited(self):
+        """是否处于API限制窗口内 - 窗口结束后自动恢复"""
+        if self.rate_limit_hit and time.time() >= self.rate_limit_reset:
+            logger.info("🔄 API限制窗口已结束，恢复请求")
+            self.rate_limit_hit = False
+        return self.rate_limit_hit
+
+    def cached_user_id(self, username):
+        """返回已缓存的用户ID，未缓存时返回None"""
+        return self.user_ids.get(username.replace('@', '').strip().lower())
+
+    def get_user_id(self, clean_username):
+        """获取用户ID - 优先使用缓存，未命中时调用API"""
+        key = clean_username.lower()
+        user_id = self.user_ids.get(key)
+        if user_id:
+            return user_id
+
+        logger.info("📡 获取用户ID...")
+        self.user_lookup_limiter.acquire()
+        user_response = self.client.get_user(username=clean_username)
+        if not user_response or not user_response.data:
+            return None
+
+        user_id = self.user_ids[key] = str(user_response.data.id)
+        return user_id
+
+    def _lookup_users(self, usernames, user_fields=None):
+        """按用户名批量查询用户 - 每次请求最多100个，遇到限制或错误时停止"""
+        for i in range(0, len(usernames), 100):
+            chunk = usernames[i:i + 100]
+            self.user_lookup_limiter.acquire()
+            try:
+                response = self.client.get_users(usernames=chunk, user_fields=user_fields)
+            except tweepy.TooManyRequests as e:
+                self._handle_rate_limit(e)
+                return
+            except Exception as e:
+                logger.error(f"❌ 批量查询用户失败: {type(e).__name__}: {e}")
+                return
+
+            for user in (response.data if response else None) or []:
+                self.user_ids[user.username.lower()] = str(user.id)
+                yield user
+
+        if usernames:
+            logger.info(f"📡 批量查询用户: 请求 {len(usernames)} 个，{(len(usernames) + 99) // 100} 次API调用")
+
+    def get_user_ids_bulk(self, usernames):
+        """批量获取用户ID - 每次请求最多100个用户名，结果写入缓存"""
+        if not self.client or self.is_rate_limited():
+            return {}
+
+        clean_usernames = {username.replace('@', '').strip() for username in usernames}
+        pending = sorted(u for u in clean_usernames if u and u.lower() not in self.user_ids)
+        for _ in self._lookup_users(pending):
+            pass
+
+        return {u: self.user_ids.get(u.lower()) for u in clean_usernames}
+
+    def get_users_info_bulk(self, usernames):
+        """批量获取用户信息 - 返回 用户名(小写) -> 用户信息，未取到的用户不在结果中"""
+        if not self.client or self.is_rate_limited():
+            return {}
+
+        clean_usernames = sorted({username.replace('@', '').strip() for username in usernames} - {''})
+        return {
+            user.username.lower(): self._user_info(user)
+            for user in self._lookup_users(clean_usernames, USER_INFO_FIELDS)
+        }
+
+    def _user_info(self, user):
+        """将tweepy用户对象转换为接口返回的用户信息"""
+        public_metrics = getattr(user, 'public_metrics', None) or {}
+        return {
+            'id': str(user.id),
+            'username': user.username,
+            'name': user.name,
+            'followers_count': public_metrics.get('followers_count', 0),
+            'following_count': public_metrics.get('following_count', 0),
+            'tweet_count': public_metrics.get('tweet_count', 0),
+            'listed_count': public_metrics.get('listed_count', 0),
+            'profile_image_url': getattr(user, 'profile_image_url', ''),
+            'description': getattr(user, 'description', ''),
+            'verified': getattr(user, 'verified', False)
+        }
+
     def ensure_connection(self):
         """确保连接可用 - 懒加载测试"""
-        if not self.connection_tested and not self.rate_limit_hit:
+        if not self.connection_tested and not self.is_rate_limited():
             logger.info("🔄 首次调用，测试连接...")
             return self.test_connection()
 
-        if self.rate_limit_hit:
+        if self.is_rate_limited():
             logger.info("📊 API限制状态，跳过连接检查")
             return False
 
@@ -176,7 +605,7 @@ class TwitterAPI:
             return None
 
         # 检查是否处于rate limit状态
-        if self.rate_limit_hit:
+        if self.is_rate_limited():
             logger.warning("❌ 当前处于API限制状态，暂时无法获取数据")
             return None
 
@@ -191,10 +620,8 @@ class TwitterAPI:
 
             # API调用
             logger.info(f"📡 调用API获取用户信息...")
-            response = self.client.get_user(
-                username=clean_username,
-                user_fields=['public_metrics', 'profile_image_url', 'description', 'verified']
-            )
+            self.user_lookup_limiter.acquire()
+            response = self.client.get_user(username=clean_username, user_fields=USER_INFO_FIELDS)
 
             logger.info(f"📡 API响应: {response is not None}")
 
@@ -202,33 +629,20 @@ class TwitterAPI:
                 logger.error(f"❌ 用户 {clean_username} 不存在或无法访问")
                 return None
 
-            user = response.data
-            public_metrics = getattr(user, 'public_metrics', {})
-
-            user_info = {
-                'id': str(user.id),
-                'username': user.username,
-                'name': user.name,
-                'followers_count': public_metrics.get('followers_count', 0),
-                'following_count': public_metrics.get('following_count', 0),
-                'tweet_count': public_metrics.get('tweet_count', 0),
-                'listed_count': public_metrics.get('listed_count', 0),
-                'profile_image_url': getattr(user, 'profile_image_url', ''),
-                'description': getattr(user, 'description', ''),
-                'verified': getattr(user, 'verified', False)
-            }
+            user_info = self._user_info(response.data)
+            self.user_ids[clean_username.lower()] = user_info['id']
 
             logger.info(f"✅ 成功获取用户信息: {user_info['name']} - {user_info['followers_count']} 关注者")
             
             # 重置rate limit标志（如果成功获取数据）
             self.rate_limit_hit = False
+            self.rate_limit_strikes = 0
             self.api_working = True
             
             return user_info
 
         except tweepy.TooManyRequests as e:
-            logger.warning(f"⚠️ API限制: {e}")
-            self.rate_limit_hit = True
+            self._handle_rate_limit(e)
             return None
         except tweepy.Unauthorized as e:
             logger.error(f"❌ 认证失败: {e}")
@@ -243,8 +657,8 @@ class TwitterAPI:
             logger.error(f"❌ 未知错误: {type(e).__name__}: {e}")
             return None
 
-    def get_user_tweets(self, username, max_results=10, start_time=None, end_time=None):
-        """获取用户推文 - 优化版"""
+    def get_user_tweets(self, username, max_results=10, start_time=None, end_time=None, user_id=None):
+        """获取用户推文 - 优化版，已知用户ID时跳过用户查询"""
         logger.info(f"🐦 开始获取推文: {username} (最多{max_results}条)")
 
         if not self.client:
@@ -252,7 +666,7 @@ class TwitterAPI:
             return []
 
         # 检查是否处于rate limit状态
-        if self.rate_limit_hit:
+        if self.is_rate_limited():
             logger.warning("❌ 当前处于API限制状态，暂时无法获取数据")
             return []
 
@@ -261,15 +675,22 @@ class TwitterAPI:
             clean_username = username.replace('@', '').strip()
             logger.info(f"🧹 清理后的用户名: {clean_username}")
 
-            # 第一步：获取用户ID
-            logger.info("📡 获取用户ID...")
-            user_response = self.client.get_user(username=clean_username)
+            cache_key = (clean_username.lower(), max_results, start_time, end_time)
+            cached_result = self.tweets_cache.get(cache_key)
+            if cached_result is not None:
+                logger.info(f"⚡ 使用缓存的推文: {clean_username} ({len(cached_result)}条)")
+                return cached_result
 
-            if not user_response or not user_response.data:
+            # 第一步：获取用户ID（优先使用数据库/内存缓存）
+            if user_id:
+                self.user_ids[clean_username.lower()] = str(user_id)
+            else:
+                user_id = self.get_user_id(clean_username)
+
+            if not user_id:
                 logger.error(f"❌ 用户 {clean_username} 不存在")
                 return []
 
-            user_id = user_response.data.id
             logger.info(f"✅ 用户ID: {user_id}")
 
             # 第二步：获取推文
@@ -295,14 +716,14 @@ class TwitterAPI:
                 logger.warning(f"⚠️ 用户 {clean_username} 没有可用的推文")
                 return []
 
-            # 处理推文数据
+            # 处理推文数据 - 已请求的字段tweepy总会设置属性，直接访问即可
             result = []
             for tweet in tweets_response.data:
-                public_metrics = getattr(tweet, 'public_metrics', {})
-                tweet_data = {
+                public_metrics = tweet.public_metrics or {}
+                result.append({
                     'id': str(tweet.id),
                     'content': tweet.text or '',
-                    'created_at': tweet.created_at.isoformat() if hasattr(tweet, 'created_at') and tweet.created_at else None,
+                    'created_at': tweet.created_at.isoformat() if tweet.created_at else None,
                     'likes': public_metrics.get('like_count', 0),
                     'retweets': public_metrics.get('retweet_count', 0),
                     'replies': public_metrics.get('reply_count', 0),
@@ -312,20 +733,20 @@ class TwitterAPI:
                     'media_urls': [],
                     'is_retweet': False,
                     'is_reply': False
-                }
-                result.append(tweet_data)
+                })
 
             logger.info(f"✅ 成功获取 {len(result)} 条推文")
+            self.tweets_cache.set(cache_key, result)
             
             # 重置rate limit标志（如果成功获取数据）
             self.rate_limit_hit = False
+            self.rate_limit_strikes = 0
             self.api_working = True
             
             return result
 
         except tweepy.TooManyRequests as e:
-            logger.warning(f"⚠️ API限制: {e}")
-            self.rate_limit_hit = True
+            self._handle_rate_limit(e)
             return []
         except tweepy.Unauthorized as e:
             logger.error(f"❌ 认证失败: {e}")
@@ -347,7 +768,13 @@ class ResearcherManager:
 
     def init_database(self):
         """初始化数据库 - 支持大规模数据存储"""
-        conn = sqlite3.connect('research_platform.db')
+        # 出错时也要关闭连接，避免占用WAL读锁
+        with closing(connect_db()) as conn:
+            self.create_schema(conn)
+        logger.info("✅ 数据库初始化完成 - 已优化支持大规模数据")
+
+    def create_schema(self, conn):
+        """创建表、索引和触发器，并迁移旧版表结构"""
         cursor = conn.cursor()
 
         # 开启外键约束和基本优化设置
@@ -355,35 +782,29 @@ class ResearcherManager:
         cursor.execute("PRAGMA synchronous = NORMAL;")  # 平衡性能和安全性
 
         # 研究者表 - 优化字段类型和索引
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS researchers (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                rank INTEGER,
-                name TEXT NOT NULL,
-                country TEXT,
-                company TEXT,
-                research_focus TEXT,
-                x_account TEXT,
-                followers_count TEXT DEFAULT '0',
-                following_count TEXT DEFAULT '0',
-                avatar_url TEXT DEFAULT '',
-                is_monitoring BOOLEAN DEFAULT 0,
-                is_special_focus BOOLEAN DEFAULT 0,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
+        cursor.execute(f'CREATE TABLE IF NOT EXISTS researchers ({RESEARCHERS_SCHEMA})')
+
+        # 旧数据库补充twitter_user_id列
+        cursor.execute('PRAGMA table_info(researchers)')
+        if 'twitter_user_id' not in [column[1] for column in cursor.fetchall()]:
+            cursor.execute('ALTER TABLE researchers ADD COLUMN twitter_user_id TEXT')
+
+        # 旧数据库的关注数为TEXT列，重建为INTEGER（索引和触发器随后重新创建）
+        self.migrate_follower_counts(conn)
 
         # 为高频查询字段创建索引
         try:
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_researchers_rank ON researchers(rank);')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_researchers_name ON researchers(name);')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_researchers_monitoring ON researchers(is_monitoring);')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_researchers_special ON researchers(is_special_focus);')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_researchers_account ON researchers(x_account);')
+            create_researcher_indexes(cursor)
+            # 部分索引只包含监控中的研究者，监控计数和到期检查只扫描这部分
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_researchers_monitoring_active ON researchers(id) WHERE is_monitoring = 1;')
+            cursor.execute('DROP INDEX IF EXISTS idx_researchers_monitoring;')
+            cursor.execute('DROP INDEX IF EXISTS idx_researchers_special;')  # 已由部分索引取代
         except Exception as e:
             logger.warning(f"创建索引时遇到警告: {e}")
 
+        # 全文检索表 - trigram分词保持与LIKE '%q%'一致的子串匹配语义
+        self.init_search_index(cursor)
+
         # 内容表 - 优化存储和索引
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS x_content (
@@ -405,12 +826,22 @@ class ResearcherManager:
 
         # 内容表索引
         try:
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_content_researcher ON x_content(researcher_id);')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_content_created ON x_content(created_at);')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_content_tweet_id ON x_content(tweet_id);')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_content_collected ON x_content(collected_at);')  # 近24小时采集数
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_content_researcher_created ON x_content(researcher_id, created_at DESC);')
+            # 升序索引隐含rowid，反向扫描即满足 created_at DESC, id DESC 的游标分页
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_content_type_time ON x_content(content_type, created_at);')
+            cursor.execute('DROP INDEX IF EXISTS idx_content_type_created;')
+
+            # 冗余索引：tweet_id已有UNIQUE自动索引，researcher_id是复合索引的前缀，只会拖慢写入
+            cursor.execute('DROP INDEX IF EXISTS idx_content_tweet_id;')
+            cursor.execute('DROP INDEX IF EXISTS idx_content_researcher;')
         except Exception as e:
             logger.warning(f"创建内容表索引时遇到警告: {e}")
 
+        # 内容汇总表 - 由触发器维护，分析接口无需全表扫描
+        self.init_analytics_totals(cursor)
+
         # 监控任务表
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS monitoring_tasks (
@@ -419,14 +850,28 @@ class ResearcherManager:
                 status TEXT DEFAULT 'active',
                 last_check DATETIME DEFAULT CURRENT_TIMESTAMP,
                 check_interval INTEGER DEFAULT 3600,
+                next_check_at DATETIME,
                 FOREIGN KEY (researcher_id) REFERENCES researchers (id) ON DELETE CASCADE
             )
         ''')
 
+        # 旧数据库补充next_check_at列 - 为空表示立即到期
+        cursor.execute('PRAGMA table_info(monitoring_tasks)')
+        if 'next_check_at' not in [column[1] for column in cursor.fetchall()]:
+            cursor.execute('ALTER TABLE monitoring_tasks ADD COLUMN next_check_at DATETIME')
+
         # 监控任务表索引
         try:
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_monitoring_researcher ON monitoring_tasks(researcher_id);')
+            # 每位研究者只保留一条任务（旧版INSERT OR REPLACE会产生重复行），唯一索引支持ON CONFLICT更新
+            cursor.execute('''
+                DELETE FROM monitoring_tasks WHERE id NOT IN (
+                    SELECT MAX(id) FROM monitoring_tasks GROUP BY researcher_id
+                )
+            ''')
+            cursor.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_monitoring_researcher_unique ON monitoring_tasks(researcher_id);')
+            cursor.execute('DROP INDEX IF EXISTS idx_monitoring_researcher;')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_monitoring_status ON monitoring_tasks(status);')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_monitoring_next_check ON monitoring_tasks(next_check_at);')
         except Exception as e:
             logger.warning(f"创建监控任务表索引时遇到警告: {e}")
 
@@ -457,85 +902,251 @@ class ResearcherManager:
         ''')
 
         conn.commit()
-        conn.close()
-        logger.info("✅ 数据库初始化完成 - 已优化支持大规模数据")
 
-    def load_sample_data(self):
-        """加载研究者示例数据 (此为应用基础数据，非动态内容)"""
-        conn = sqlite3.connect('research_platform.db')
-        cursor = conn.cursor()
+        # 首次建库后收集统计信息，让查询规划器使用新建的索引
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'")
+        if cursor.fetchone() is None:
+            cursor.execute('ANALYZE')
+            conn.commit()
 
-        # 检查是否已经加载过示例数据
-        cursor.execute('SELECT value FROM db_metadata WHERE key = ?', ('sample_data_loaded',))
-        if cursor.fetchone():
-            conn.close()
+    def migrate_follower_counts(self, conn):
+        """将TEXT类型的关注数列（如'127K'）重建为INTEGER存储"""
+        cursor = conn.cursor()
+        cursor.execute('PRAGMA table_info(researchers)')
+        column_types = {column[1]: column[2] for column in cursor.fetchall()}
+        if column_types.get('followers_count') != 'TEXT':
             return
 
-        researchers_data = [
-            {
-                'rank': 1, 'name': 'Ilya Sutskever', 'country': 'Canada', 'company': 'SSI',
-                'research_focus': 'AlexNet、Seq2seq、深度学习', 'x_account': '@ilyasut',
-                'followers_count': '127K', 'following_count': '89'
-            },
-            {
-                'rank': 2, 'name': 'Noam Shazeer', 'country': 'USA', 'company': 'Google Deepmind',
-                'research_focus': '注意力机制、混合专家模型、角色AI', 'x_account': '@noamshazeer',
-                'followers_count': '45K', 'following_count': '156'
-            },
-            {
-                'rank': 3, 'name': 'Geoffrey Hinton', 'country': 'UK', 'company': 'University of Toronto',
-                'research_focus': '反向传播、玻尔兹曼机、深度学习', 'x_account': '@geoffreyhinton',
-                'followers_count': '234K', 'following_count': '67'
-            },
-            {
-                'rank': 4, 'name': 'Alec Radford', 'country': 'USA', 'company': 'Thinking Machines',
-                'research_focus': '生成对抗网络、GPT、CLIP', 'x_account': '@alec_radford',
-                'followers_count': '89K', 'following_count': '123'
-            },
-            {
-                'rank': 5, 'name': 'Andrej Karpathy', 'country': 'Slovakia', 'company': 'Tesla',
-                'research_focus': '计算机视觉、神经网络、自动驾驶', 'x_account': '@karpathy',
-                'followers_count': '512K', 'following_count': '234'
-            }
-        ]
+        logger.info("🔄 迁移研究者关注数为INTEGER...")
+        columns = '''id, rank, name, country, company, research_focus, x_account,
+            followers_count, following_count, avatar_url, is_monitoring, is_special_focus,
+            created_at, updated_at, twitter_user_id'''
 
-        for researcher in researchers_data:
+        # 删除旧表时不能级联删除内容和监控任务
+        conn.commit()
+        cursor.execute('PRAGMA foreign_keys = OFF;')
+        try:
+            cursor.execute('BEGIN')
+            cursor.execute(f'CREATE TABLE researchers_new ({RESEARCHERS_SCHEMA})')
+            cursor.execute(f'INSERT INTO researchers_new ({columns}) SELECT {columns} FROM researchers')
+
+            # 纯数字文本已按INTEGER亲和性自动转换，剩余的'127K'等格式在Python中解析
             cursor.execute('''
-                INSERT OR IGNORE INTO researchers
-                (rank, name, country, company, research_focus, x_account, followers_count, following_count)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                researcher['rank'], researcher['name'], researcher['country'],
-                researcher['company'], researcher['research_focus'], researcher['x_account'],
-                researcher['followers_count'], researcher['following_count']
-            ))
-
-        # 标记示例数据已加载
-        cursor.execute('INSERT OR REPLACE INTO db_metadata (key, value) VALUES (?, ?)',
-                      ('sample_data_loaded', 'true'))
+                SELECT id, followers_count, following_count FROM researchers_new
+                WHERE typeof(followers_count) != 'integer' OR typeof(following_count) != 'integer'
+            ''')
+            cursor.executemany(
+                'UPDATE researchers_new SET followers_count = ?, following_count = ? WHERE id = ?',
+                [(parse_count(row[1]), parse_count(row[2]), row[0]) for row in cursor.fetchall()]
+            )
 
-        conn.commit()
-        conn.close()
-        logger.info("✅ 示例数据加载完成")
+            cursor.execute('DROP TABLE researchers')
+            cursor.execute('ALTER TABLE researchers_new RENAME TO researchers')
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.execute('PRAGMA foreign_keys = ON;')
+
+    def init_analytics_totals(self, cursor):
+        """创建内容/研究者计数的汇总表及维护触发器"""
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS analytics_totals (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                total_engagement INTEGER DEFAULT 0,
+                total_content INTEGER DEFAULT 0,
+                total_researchers INTEGER DEFAULT 0,
+                monitoring_researchers INTEGER DEFAULT 0
+            )
+        ''')
+
+        # 旧数据库补充研究者计数列
+        cursor.execute('PRAGMA table_info(analytics_totals)')
+        researcher_columns_missing = 'total_researchers' not in [column[1] for column in cursor.fetchall()]
+        if researcher_columns_missing:
+            cursor.execute('ALTER TABLE analytics_totals ADD COLUMN total_researchers INTEGER DEFAULT 0')
+            cursor.execute('ALTER TABLE analytics_totals ADD COLUMN monitoring_researchers INTEGER DEFAULT 0')
+
+        # 首次创建时用现有数据初始化
+        cursor.execute('''
+            INSERT OR IGNORE INTO analytics_totals (id, total_engagement, total_content)
+            SELECT 1, COALESCE(SUM(likes_count + retweets_count + replies_count), 0), COUNT(*)
+            FROM x_content
+        ''')
+        cursor.execute('SELECT changes()')
+        if cursor.fetchone()[0] or researcher_columns_missing:
+            cursor.execute('''
+                UPDATE analytics_totals SET
+                    total_researchers = (SELECT COUNT(*) FROM researchers),
+                    monitoring_researchers = (SELECT COUNT(*) FROM researchers WHERE is_monitoring = 1)
+                WHERE id = 1
+            ''')
+
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS researchers_totals_ai AFTER INSERT ON researchers BEGIN
+                UPDATE analytics_totals SET
+                    total_researchers = total_researchers + 1,
+                    monitoring_researchers = monitoring_researchers + (new.is_monitoring = 1)
+                WHERE id = 1;
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS researchers_totals_ad AFTER DELETE ON researchers BEGIN
+                UPDATE analytics_totals SET
+                    total_researchers = total_researchers - 1,
+                    monitoring_researchers = monitoring_researchers - (old.is_monitoring = 1)
+                WHERE id = 1;
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS researchers_totals_au
+            AFTER UPDATE OF is_monitoring ON researchers BEGIN
+                UPDATE analytics_totals SET
+                    monitoring_researchers = monitoring_researchers
+                        + (new.is_monitoring = 1) - (old.is_monitoring = 1)
+                WHERE id = 1;
+            END
+        ''')
+
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS x_content_totals_ai AFTER INSERT ON x_content BEGIN
+                UPDATE analytics_totals SET
+                    total_content = total_content + 1,
+                    total_engagement = total_engagement
+                        + COALESCE(new.likes_count + new.retweets_count + new.replies_count, 0)
+                WHERE id = 1;
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS x_content_totals_ad AFTER DELETE ON x_content BEGIN
+                UPDATE analytics_totals SET
+                    total_content = total_content - 1,
+                    total_engagement = total_engagement
+                        - COALESCE(old.likes_count + old.retweets_count + old.replies_count, 0)
+                WHERE id = 1;
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS x_content_totals_au
+            AFTER UPDATE OF likes_count, retweets_count, replies_count ON x_content BEGIN
+                UPDATE analytics_totals SET
+                    total_engagement = total_engagement
+                        + COALESCE(new.likes_count + new.retweets_count + new.replies_count, 0)
+                        - COALESCE(old.likes_count + old.retweets_count + old.replies_count, 0)
+                WHERE id = 1;
+            END
+        ''')
+
+    def init_search_index(self, cursor):
+        """创建研究者FTS5检索表及同步触发器，不支持时回退到LIKE搜索"""
+        self.fts_enabled = False
+        try:
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'researchers_fts'")
+            fts_exists = cursor.fetchone() is not None
+
+            cursor.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS researchers_fts USING fts5(
+                    name, company, research_focus,
+                    content='researchers', content_rowid='id', tokenize='trigram'
+                )
+            ''')
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS researchers_fts_ai AFTER INSERT ON researchers BEGIN
+                    INSERT INTO researchers_fts (rowid, name, company, research_focus)
+                    VALUES (new.id, new.name, new.company, new.research_focus);
+                END
+            ''')
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS researchers_fts_ad AFTER DELETE ON researchers BEGIN
+                    INSERT INTO researchers_fts (researchers_fts, rowid, name, company, research_focus)
+                    VALUES ('delete', old.id, old.name, old.company, old.research_focus);
+                END
+            ''')
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS researchers_fts_au
+                AFTER UPDATE OF name, company, research_focus ON researchers BEGIN
+                    INSERT INTO researchers_fts (researchers_fts, rowid, name, company, research_focus)
+                    VALUES ('delete', old.id, old.name, old.company, old.research_focus);
+                    INSERT INTO researchers_fts (rowid, name, company, research_focus)
+                    VALUES (new.id, new.name, new.company, new.research_focus);
+                END
+            ''')
+
+            # 已有数据库首次创建检索表时，补建索引
+            if not fts_exists:
+                cursor.execute("INSERT INTO researchers_fts (researchers_fts) VALUES ('rebuild')")
+
+            self.fts_enabled = True
+        except Exception as e:
+            logger.warning(f"FTS5全文检索不可用，搜索将回退到LIKE: {e}")
+
+    def load_sample_data(self):
+        """加载研究者示例数据 (此为应用基础数据，非动态内容)"""
+        with closing(connect_db()) as conn:
+            cursor = conn.cursor()
+
+            # 检查是否已经加载过示例数据
+            cursor.execute('SELECT value FROM db_metadata WHERE key = ?', ('sample_data_loaded',))
+            if cursor.fetchone():
+                return
+
+            researchers_data = [
+                {
+                    'rank': 1, 'name': 'Ilya Sutskever', 'country': 'Canada', 'company': 'SSI',
+                    'research_focus': 'AlexNet、Seq2seq、深度学习', 'x_account': '@ilyasut',
+                    'followers_count': 127000, 'following_count': 89
+                },
+                {
+                    'rank': 2, 'name': 'Noam Shazeer', 'country': 'USA', 'company': 'Google Deepmind',
+                    'research_focus': '注意力机制、混合专家模型、角色AI', 'x_account': '@noamshazeer',
+                    'followers_count': 45000, 'following_count': 156
+                },
+                {
+                    'rank': 3, 'name': 'Geoffrey Hinton', 'country': 'UK', 'company': 'University of Toronto',
+                    'research_focus': '反向传播、玻尔兹曼机、深度学习', 'x_account': '@geoffreyhinton',
+                    'followers_count': 234000, 'following_count': 67
+                },
+                {
+                    'rank': 4, 'name': 'Alec Radford', 'country': 'USA', 'company': 'Thinking Machines',
+                    'research_focus': '生成对抗网络、GPT、CLIP', 'x_account': '@alec_radford',
+                    'followers_count': 89000, 'following_count': 123
+                },
+                {
+                    'rank': 5, 'name': 'Andrej Karpathy', 'country': 'Slovakia', 'company': 'Tesla',
+                    'research_focus': '计算机视觉、神经网络、自动驾驶', 'x_account': '@karpathy',
+                    'followers_count': 512000, 'following_count': 234
+                }
+            ]
+
+            cursor.executemany(INSERT_SAMPLE_RESEARCHER_SQL, [
+                (
+                    researcher['rank'], researcher['name'], researcher['country'],
+                    researcher['company'], researcher['research_focus'], researcher['x_account'],
+                    researcher['followers_count'], researcher['following_count']
+                ) for researcher in researchers_data
+            ])
+
+            # 标记示例数据已加载
+            cursor.execute('INSERT OR REPLACE INTO db_metadata (key, value) VALUES (?, ?)',
+                          ('sample_data_loaded', 'true'))
+
+            conn.commit()
+            logger.info("✅ 示例数据加载完成")
 
     def load_sample_data_if_empty(self):
         """仅在数据库为空时加载示例数据"""
-        conn = sqlite3.connect('research_platform.db')
-        cursor = conn.cursor()
+        with closing(connect_db()) as conn:
+            count = conn.execute('SELECT COUNT(*) FROM researchers').fetchone()[0]
 
-        cursor.execute('SELECT COUNT(*) FROM researchers')
-        count = cursor.fetchone()[0]
+            if count == 0:
+                # 重置加载标记
+                conn.execute('DELETE FROM db_metadata WHERE key = ?', ('sample_data_loaded',))
+                conn.commit()
 
         if count == 0:
-            # 重置加载标记
-            cursor.execute('DELETE FROM db_metadata WHERE key = ?', ('sample_data_loaded',))
-            conn.commit()
-            conn.close()
-
             # 重新加载示例数据
             self.load_sample_data()
-        else:
-            conn.close()
 
 # 监控任务 - 优化支持大规模监控
 class MonitoringService:
@@ -543,16 +1154,20 @@ class MonitoringService:
         self.running = False
         self.thread = None
         self.max_concurrent_checks = 10  # 最大并发检查数
+        # 推文拉取线程池常驻复用，避免每批重新创建线程
+        self.executor = ThreadPoolExecutor(max_workers=self.max_concurrent_checks, thread_name_prefix='monitor-fetch')
+        self.wake_event = threading.Event()  # 间隔变更或新增监控时唤醒监控线程
+        self.maintenance_interval = 6 * 3600  # 数据库维护周期（秒）
+        self.last_maintenance = time.monotonic()
         self.current_interval = self.get_monitoring_interval()  # 从数据库获取间隔
 
     def get_monitoring_interval(self):
         """从数据库获取监控间隔设置"""
         try:
-            conn = sqlite3.connect('research_platform.db')
+            conn = get_db()
             cursor = conn.cursor()
             cursor.execute('SELECT setting_value FROM system_settings WHERE setting_key = ?', ('monitoring_interval',))
             result = cursor.fetchone()
-            conn.close()
 
             if result:
                 return int(result[0])
@@ -565,17 +1180,24 @@ class MonitoringService:
     def update_monitoring_interval(self, interval_seconds):
         """更新监控间隔设置"""
         try:
-            conn = sqlite3.connect('research_platform.db')
+            conn = get_db()
             cursor = conn.cursor()
             cursor.execute('''
                 UPDATE system_settings
                 SET setting_value = ?, updated_at = CURRENT_TIMESTAMP
                 WHERE setting_key = ?
             ''', (str(interval_seconds), 'monitoring_interval'))
+
+            # 按新间隔重新排期已检查过的研究者
+            cursor.execute('''
+                UPDATE monitoring_tasks SET next_check_at = datetime(last_check, ?)
+                WHERE last_check IS NOT NULL
+            ''', (f'+{interval_seconds} seconds',))
             conn.commit()
-            conn.close()
 
             self.current_interval = interval_seconds
+            self.wake()
+            invalidate_caches()
             logger.info(f"✅ 监控间隔已更新为 {interval_seconds} 秒")
             return True
         except Exception as e:
@@ -589,107 +1211,256 @@ class MonitoringService:
             self.thread = threading.Thread(target=self._monitoring_loop, daemon=True)
             self.thread.start()
             logger.info(f"🚀 监控服务已启动 - 支持大规模监控，检查间隔: {self.current_interval}秒")
+        else:
+            self.wake()
+
+    def wake(self):
+        """唤醒监控线程，立即检查到期的研究者"""
+        self.wake_event.set()
 
     def _monitoring_loop(self):
-        """监控循环 - 使用可配置的时间间隔"""
+        """监控循环 - 按各研究者的到期时间调度，可被提前唤醒"""
         while self.running:
             try:
                 self._check_researchers_batch()
-                # 使用当前设置的间隔时间
-                time.sleep(self.current_interval)
+                if time.monotonic() - self.last_maintenance >= self.maintenance_interval:
+                    self._run_maintenance()
+                wait_seconds = self._seconds_until_next_check()
             except Exception as e:
                 logger.error(f"监控循环错误: {e}")
-                time.sleep(60)  # 出错时等待1分钟后重试
+                wait_seconds = 60  # 出错时等待1分钟后重试
+            self.wake_event.wait(wait_seconds)
+            self.wake_event.clear()
+
+    def _run_maintenance(self):
+        """定期维护 - 更新查询规划统计信息，并截断持续增长的WAL文件"""
+        self.last_maintenance = time.monotonic()
+        try:
+            conn = get_db()
+            conn.execute('PRAGMA optimize;')  # 仅对统计信息过期的表执行ANALYZE
+            busy, log_pages, checkpointed = conn.execute('PRAGMA wal_checkpoint(TRUNCATE);').fetchone()
+            logger.info(f"🧹 数据库维护完成 - WAL检查点: {checkpointed}/{log_pages} 页{'（有读写未完成）' if busy else ''}")
+        except Exception as e:
+            logger.warning(f"数据库维护失败: {e}")
+
+    def _next_check_delay(self, factor):
+        """按监控间隔和倍数计算下次检查的延迟，限制在允许的间隔范围内"""
+        return min(max(int(self.current_interval * factor), 300), 604800)
+
+    def _seconds_until_next_check(self):
+        """距离最早到期研究者的秒数 - 至少等待1分钟，最多等待一个监控间隔"""
+        cursor = get_db().cursor()
+        cursor.execute('''
+            SELECT MIN(COALESCE(strftime('%s', mt.next_check_at), 0)) - strftime('%s', 'now')
+            FROM researchers r
+            LEFT JOIN monitoring_tasks mt ON mt.researcher_id = r.id
+            WHERE r.is_monitoring = 1
+        ''')
+        seconds = cursor.fetchone()[0]
+        wait_seconds = self.current_interval if seconds is None else min(max(seconds, 60), self.current_interval)
+
+        # API限制期间无需醒来
+        if twitter_api and twitter_api.is_rate_limited():
+            wait_seconds = max(wait_seconds, twitter_api.rate_limit_reset - time.time())
+        return wait_seconds
 
     def _check_researchers_batch(self):
-        """批量检查正在监控的研究者"""
-        conn = sqlite3.connect('research_platform.db')
+        """批量检查到期的监控研究者"""
+        conn = get_db()
         cursor = conn.cursor()
 
-        cursor.execute('SELECT id, name, x_account FROM researchers WHERE is_monitoring = 1')
-        researchers = cursor.fetchall()
-        conn.close()
+        batch_size = 50  # 每批处理50个
+        checked_count = 0
 
-        logger.info(f"🔍 开始检查 {len(researchers)} 位研究者的内容")
+        # 只检查已到期的研究者，从未检查过的（next_check_at为空）排在最前
+        # 每批处理后研究者被排期到未来，重新查询即得到下一批，内存占用只与批大小有关
+        while True:
+            # 遇到API限制时停止，剩余研究者保持到期状态，限制解除后优先检查
+            if twitter_api.is_rate_limited():
+                logger.warning("⚠️ API限制中，剩余到期研究者推迟检查")
+                break
 
-        # 分批处理，避免同时处理过多研究者
-        batch_size = 50  # 每批处理50个
-        for i in range(0, len(researchers), batch_size):
-            batch = researchers[i:i + batch_size]
-            self._process_researcher_batch(batch)
-            time.sleep(5)  # 批次间休息5秒
+            batch = cursor.execute(SELECT_DUE_RESEARCHERS_SQL, (batch_size,)).fetchall()
+            if not batch:
+                break
+
+            # 尚未保存用户ID的研究者按批一次性查询，避免逐个调用get_user
+            missing_accounts = [x_account for _, _, x_account, twitter_user_id in batch
+                                if x_account and not twitter_user_id]
+            if missing_accounts:
+                twitter_api.get_user_ids_bulk(missing_accounts)
+
+            checked_count += len(batch)
+            # 写入失败时研究者仍处于到期状态，停止本轮以免重复拉取同一批
+            if not self._process_researcher_batch(batch):
+                break
+
+        logger.info(f"🔍 本轮检查了 {checked_count} 位研究者的内容")
 
     def _process_researcher_batch(self, researchers_batch):
-        """处理一批研究者"""
-        for researcher_id, name, x_account in researchers_batch:
+        """处理一批研究者 - 并发拉取推文，汇总后在单个事务中写入并安排下次检查，返回是否写入成功"""
+        content_rows = {}  # 研究者ID -> 待写入的推文行
+        new_user_ids = []
+
+        # 推文拉取是网络I/O，使用常驻线程池并发发起请求
+        futures = {
+            self.executor.submit(twitter_api.get_user_tweets, x_account, 5, user_id=twitter_user_id):
+                (researcher_id, name, x_account, twitter_user_id)
+            for researcher_id, name, x_account, twitter_user_id in researchers_batch
+        }
+
+        for future in as_completed(futures):
+            researcher_id, name, x_account, twitter_user_id = futures[future]
+            if not twitter_user_id and twitter_api.cached_user_id(x_account):
+                new_user_ids.append((twitter_api.cached_user_id(x_account), researcher_id))
             try:
-                tweets = twitter_api.get_user_tweets(x_account, max_results=5)
+                tweets = future.result()
+            except Exception as e:
+                logger.error(f"检查 {name} 时出错: {e}")
+                tweets = None
 
-                if not tweets:
-                    continue
+            content_rows[researcher_id] = tweet_rows(researcher_id, tweets) if tweets else []
 
-                conn = sqlite3.connect('research_platform.db')
-                cursor = conn.cursor()
+        # 遇到API限制而未取到数据的研究者，推迟到限制解除之后
+        rate_limit_delay = None
+        if twitter_api.is_rate_limited():
+            rate_limit_delay = max(int(twitter_api.rate_limit_reset - time.time()), 0) + 1
 
+        conn = get_db()
+        try:
+            with conn:
+                cursor = conn.cursor()
                 new_tweets_count = 0
-                for tweet in tweets:
-                    cursor.execute('''
-                        INSERT OR IGNORE INTO x_content
-                        (researcher_id, tweet_id, content, likes_count, retweets_count, replies_count, created_at)
-                        VALUES (?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        researcher_id, tweet['id'], tweet['content'],
-                        tweet['likes'], tweet['retweets'], tweet['replies'],
-                        tweet['created_at']
-                    ))
-                    if cursor.rowcount > 0:
-                        new_tweets_count += 1
-
-                # 更新最后检查时间
-                cursor.execute('''
-                    UPDATE monitoring_tasks SET last_check = CURRENT_TIMESTAMP
-                    WHERE researcher_id = ?
-                ''', (researcher_id,))
+                schedule = []
+                for researcher_id, rows in content_rows.items():
+                    inserted = insert_content_batch(cursor, rows)
+                    new_tweets_count += inserted
+
+                    # 有新推文的研究者提前检查，没有的放慢频率
+                    if not rows and rate_limit_delay is not None:
+                        delay = rate_limit_delay
+                    else:
+                        delay = self._next_check_delay(0.5 if inserted else 2.0)
+                    schedule.append((researcher_id, f'+{delay} seconds'))
+
+                # 保存新查询到的用户ID，下次检查无需再查询用户
+                cursor.executemany(UPDATE_TWITTER_USER_ID_SQL, new_user_ids)
+
+                # 记录检查时间和下次到期时间
+                cursor.executemany(SCHEDULE_MONITORING_TASK_SQL, schedule)
+
+            if new_tweets_count > 0:
+                invalidate_caches()
+                logger.info(f"✅ 本批 {len(content_rows)} 位研究者更新了 {new_tweets_count} 条新内容")
+            return True
 
-                conn.commit()
-                conn.close()
+        except Exception as e:
+            logger.error(f"写入监控内容失败: {e}")
+            return False
 
-                if new_tweets_count > 0:
-                    logger.info(f"✅ {name} 更新了 {new_tweets_count} 条新内容")
+# 初始化 - 推迟到首次请求或 flask init-db 执行，导入模块时不访问数据库
+researcher_manager = None
+twitter_api = None
+monitoring_service = None
+app_initialized = False
+init_lock = threading.Lock()
 
-            except Exception as e:
-                logger.error(f"检查 {name} 时出错: {e}")
-                time.sleep(1)  # 出错时稍作等待
-
-# 初始化
-try:
-    researcher_manager = ResearcherManager()
-    logger.info("✅ 研究者管理器初始化成功")
-except Exception as e:
-    logger.error(f"❌ 研究者管理器初始化失败: {e}")
-    researcher_manager = None
-
-try:
-    twitter_api = TwitterAPI()
-    logger.info("✅ Twitter API初始化完成")
-except Exception as e:
-    logger.error(f"❌ Twitter API初始化失败: {e}")
-    twitter_api = None
-
-# 初始化监控服务
-try:
-    monitoring_service = MonitoringService()
-    logger.info("✅ 监控服务初始化成功")
-except Exception as e:
-    logger.error(f"❌ 监控服务初始化失败: {e}")
-    monitoring_service = None
+# 组件状态在初始化后不再变化，健康检查和初始化状态接口直接复用
+component_status = {}
+init_status_body = b'{}'
+
+def init_app_state():
+    """初始化数据库和各服务组件 - 每个进程只执行一次"""
+    global researcher_manager, twitter_api, monitoring_service, app_initialized
+    global component_status, init_status_body
+
+    with init_lock:
+        if app_initialized:
+            return
+
+        try:
+            researcher_manager = ResearcherManager()
+            atexit.register(optimize_on_exit)
+            logger.info("✅ 研究者管理器初始化成功")
+        except Exception as e:
+            logger.error(f"❌ 研究者管理器初始化失败: {e}")
+            researcher_manager = None
+
+        try:
+            twitter_api = TwitterAPI()
+            logger.info("✅ Twitter API初始化完成")
+        except Exception as e:
+            logger.error(f"❌ Twitter API初始化失败: {e}")
+            twitter_api = None
+
+        # 初始化监控服务
+        try:
+            monitoring_service = MonitoringService()
+            logger.info("✅ 监控服务初始化成功")
+        except Exception as e:
+            logger.error(f"❌ 监控服务初始化失败: {e}")
+            monitoring_service = None
+
+        component_status = {
+            'researcher_manager': 'ok' if researcher_manager else 'failed',
+            'twitter_api': 'ok' if twitter_api else 'failed',
+            'monitoring_service': 'ok' if monitoring_service else 'failed'
+        }
+        init_status_body = orjson.dumps({
+            'initialized': bool(researcher_manager),
+            'components': {
+                'database': bool(researcher_manager),
+                'twitter_api': bool(twitter_api),
+                'monitoring': bool(monitoring_service)
+            },
+            'ready': bool(researcher_manager and twitter_api and monitoring_service)
+        })
+
+        app_initialized = True
+
+def optimize_on_exit():
+    """进程退出前更新查询规划统计信息"""
+    try:
+        conn = connect_db()
+        conn.execute('PRAGMA busy_timeout=1000;')  # 退出时不长时间等待写锁
+        conn.execute('PRAGMA optimize;')
+        conn.close()
+    except Exception as e:
+        logger.warning(f"退出时数据库优化失败: {e}")
+
+@app.before_request
+def ensure_app_state():
+    """首次请求时初始化应用组件"""
+    if not app_initialized:
+        init_app_state()
+
+@app.cli.command('init-db')
+def init_db_command():
+    """初始化数据库表结构和示例数据: flask --app app init-db"""
+    init_app_state()
+    if researcher_manager:
+        logger.info(f"✅ 数据库已初始化: {DB_FILE}")
+    else:
+        logger.error("❌ 数据库初始化失败")
+
+# 主页模板不含运行时变量，首次请求渲染后缓存
+index_html = None
+index_etag = None
 
 # API路由
 @app.route('/')
 def index():
     """主页路由 - 返回HTML模板"""
+    global index_html, index_etag
     try:
-        return render_template('index.html')
+        if index_html is None:
+            index_html = render_template('index.html').encode('utf-8')
+            index_etag = hashlib.sha1(index_html).hexdigest()
+        response = app.response_class(index_html, mimetype='text/html')
+        response.cache_control.public = True
+        response.cache_control.max_age = 300
+        response.set_etag(index_etag)
+        return response.make_conditional(request)
     except Exception as e:
         logger.error(f"主页加载失败: {e}")
         return f"模板加载失败: {str(e)}<br>请确保 templates/index.html 文件存在", 500
@@ -700,10 +1471,18 @@ def get_researchers():
     if not researcher_manager:
         return jsonify({'error': 'System not properly initialized'}), 500
 
-    conn = sqlite3.connect('research_platform.db')
+    search_query = request.args.get('search', '')
+
+    # 无搜索条件的列表按查询串缓存
+    cache_key = None if search_query else request.query_string
+    if cache_key is not None:
+        cached_body = researchers_cache.get(cache_key)
+        if cached_body is not None:
+            return json_response(cached_body)
+
+    conn = get_db()
     cursor = conn.cursor()
 
-    search_query = request.args.get('search', '')
     page = request.args.get('page', 1, type=int)
     per_page = request.args.get('per_page', 50, type=int)
 
@@ -713,39 +1492,40 @@ def get_researchers():
 
     try:
         if search_query:
-            # 搜索查询
-            count_query = '''
-                SELECT COUNT(*) FROM researchers
-                WHERE name LIKE ? OR company LIKE ? OR research_focus LIKE ?
-            '''
-            cursor.execute(count_query, (f'%{search_query}%', f'%{search_query}%', f'%{search_query}%'))
-            total_count = cursor.fetchone()[0]
+            if researcher_manager.fts_enabled and len(search_query) >= 3:
+                # 全文检索 - 短语查询即子串匹配
+                match_query = '"' + search_query.replace('"', '""') + '"'
+                where_clause = 'WHERE id IN (SELECT rowid FROM researchers_fts WHERE researchers_fts MATCH ?)'
+                params = (match_query,)
+            else:
+                # 搜索词少于3个字符时trigram无法匹配，回退到LIKE
+                where_clause = 'WHERE name LIKE ? OR company LIKE ? OR research_focus LIKE ?'
+                params = (f'%{search_query}%', f'%{search_query}%', f'%{search_query}%')
 
-            data_query = '''
-                SELECT * FROM researchers
-                WHERE name LIKE ? OR company LIKE ? OR research_focus LIKE ?
-                ORDER BY rank LIMIT ? OFFSET ?
-            '''
-            cursor.execute(data_query, (f'%{search_query}%', f'%{search_query}%', f'%{search_query}%', per_page, offset))
+            # 窗口函数在同一次匹配中返回总数，避免COUNT再匹配一遍
+            total_column = 'COUNT(*) OVER ()'
+        else:
+            # 普通查询 - 不相关子查询只执行一次，总数与分页数据一次取回
+            where_clause, params = '', ()
+            total_column = '(SELECT COUNT(*) FROM researchers)'
+
+        cursor.execute(f'''
+            SELECT {RESEARCHER_COLUMNS}, {total_column} AS total_count FROM researchers
+            {where_clause}
+            ORDER BY rank LIMIT ? OFFSET ?
+        ''', params + (per_page, offset))
+        rows = cursor.fetchall()
+
+        if rows:
+            total_count = rows[0]['total_count']
         else:
-            # 普通查询
-            cursor.execute('SELECT COUNT(*) FROM researchers')
+            # 页码超出范围时没有返回行，单独统计总数
+            cursor.execute(f'SELECT COUNT(*) FROM researchers {where_clause}', params)
             total_count = cursor.fetchone()[0]
 
-            cursor.execute('SELECT * FROM researchers ORDER BY rank LIMIT ? OFFSET ?', (per_page, offset))
-
-        researchers = []
-        for row in cursor.fetchall():
-            researchers.append({
-                'id': row[0], 'rank': row[1], 'name': row[2], 'country': row[3],
-                'company': row[4], 'research_focus': row[5], 'x_account': row[6],
-                'followers_count': row[7], 'following_count': row[8],
-                'is_monitoring': bool(row[10]), 'is_special_focus': bool(row[11])
-            })
-
-        conn.close()
+        researchers = [researcher_dict(row) for row in rows]
 
-        return jsonify({
+        body = orjson.dumps({
             'researchers': researchers,
             'pagination': {
                 'page': page,
@@ -753,51 +1533,40 @@ def get_researchers():
                 'total': total_count,
                 'pages': (total_count + per_page - 1) // per_page
             }
-        })
+        }, option=OrjsonProvider.option)
+        if cache_key is not None:
+            researchers_cache.set(cache_key, body)
+
+        return json_response(body)
 
     except Exception as e:
         logger.error(f"获取研究者列表失败: {e}")
-        conn.close()
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/researcher/<int:researcher_id>')
 def get_researcher_detail(researcher_id):
     """获取研究者详情"""
-    conn = sqlite3.connect('research_platform.db')
+    conn = get_db()
     cursor = conn.cursor()
 
-    cursor.execute('SELECT * FROM researchers WHERE id = ?', (researcher_id,))
+    cursor.execute(f'SELECT {RESEARCHER_COLUMNS} FROM researchers WHERE id = ?', (researcher_id,))
     researcher_row = cursor.fetchone()
 
     if not researcher_row:
-        conn.close()
         return jsonify({'error': 'Researcher not found'}), 404
 
-    researcher = {
-        'id': researcher_row[0], 'rank': researcher_row[1], 'name': researcher_row[2],
-        'country': researcher_row[3], 'company': researcher_row[4],
-        'research_focus': researcher_row[5], 'x_account': researcher_row[6],
-        'followers_count': researcher_row[7], 'following_count': researcher_row[8],
-        'is_monitoring': bool(researcher_row[10]), 'is_special_focus': bool(researcher_row[11])
-    }
+    researcher = researcher_dict(researcher_row)
 
     # 获取最新内容
     cursor.execute('''
-        SELECT * FROM x_content WHERE researcher_id = ?
+        SELECT id, content, likes_count AS likes, retweets_count AS retweets,
+               replies_count AS replies, created_at
+        FROM x_content WHERE researcher_id = ?
         ORDER BY created_at DESC LIMIT 10
     ''', (researcher_id,))
-    content_rows = cursor.fetchall()
-
-    conn.close()
+    recent_content = [dict(row) for row in cursor.fetchall()]
 
-    recent_content = [
-        {
-            'id': c[0], 'content': c[3], 'likes': c[5],
-            'retweets': c[6], 'replies': c[7], 'created_at': c[8]
-        } for c in content_rows
-    ]
-
-    return jsonify({
+    return json_response({
         'researcher': researcher,
         'recent_content': recent_content
     })
@@ -806,15 +1575,13 @@ def get_researcher_detail(researcher_id):
 def delete_researcher(researcher_id):
     """删除指定的研究者及其所有相关数据"""
     try:
-        conn = sqlite3.connect('research_platform.db')
-        cursor = conn.cursor()
-
-        cursor.execute("PRAGMA foreign_keys = ON;")
-        cursor.execute('DELETE FROM researchers WHERE id = ?', (researcher_id,))
+        # 连接打开时已启用foreign_keys，级联删除相关内容和监控任务
+        conn = get_db()
+        with conn:
+            deleted = conn.execute('DELETE FROM researchers WHERE id = ?', (researcher_id,)).rowcount
 
-        conn.commit()
-
-        if cursor.rowcount > 0:
+        if deleted > 0:
+            invalidate_caches()
             logger.info(f"✅ 成功删除研究者 ID: {researcher_id}")
             return jsonify({'message': f'成功删除研究者 ID: {researcher_id}'}), 200
         else:
@@ -824,77 +1591,102 @@ def delete_researcher(researcher_id):
     except Exception as e:
         logger.error(f"❌ 删除研究者 {researcher_id} 时发生错误: {e}")
         return jsonify({'error': 'Internal server error'}), 500
-    finally:
-        if conn:
-            conn.close()
 
 @app.route('/api/content')
 def get_content():
-    """获取所有内容 - 支持分页"""
-    conn = sqlite3.connect('research_platform.db')
+    """获取所有内容 - 支持游标分页，page参数保留兼容"""
+    conn = get_db()
     cursor = conn.cursor()
 
-    page = request.args.get('page', 1, type=int)
-    per_page = request.args.get('per_page', 20, type=int)
-    per_page = min(per_page, 100)  # 限制最大每页数量
-    offset = (page - 1) * per_page
+    # 游标分页：cursor=<created_at>&cursor_id=<id>，耗时与翻页深度无关
+    cursor_time = request.args.get('cursor')
+    cursor_id = request.args.get('cursor_id', type=int)
+    keyset = cursor_time is not None and cursor_id is not None
+
+    page = max(request.args.get('page', 1, type=int), 1)
+    # 前端使用limit参数，per_page优先；非数字时回退默认值
+    per_page = request.args.get('per_page', request.args.get('limit', 20, type=int), type=int)
+    per_page = max(min(per_page, 100), 1)  # 限制最大每页数量
+    offset = 0 if keyset else (page - 1) * per_page
+    content_type = request.args.get('type', 'all')
+
+    conditions, params = [], []
+    if content_type != 'all':
+        conditions.append('c.content_type = ?')
+        params.append(content_type)
+    filter_params = tuple(params)
+    filter_clause = f"WHERE {conditions[0]}" if conditions else ''
+    if keyset:
+        conditions.append('(c.created_at, c.id) < (?, ?)')
+        params.extend((cursor_time, cursor_id))
+    where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ''
 
     try:
-        # 获取总数
-        cursor.execute('SELECT COUNT(*) FROM x_content')
-        total_count = cursor.fetchone()[0]
-
-        query = '''
-            SELECT c.id, c.content, c.content_type, c.likes_count, c.retweets_count,
-                   c.replies_count, c.created_at, c.collected_at, r.name, r.x_account
-            FROM x_content c
-            JOIN researchers r ON c.researcher_id = r.id
-            ORDER BY c.created_at DESC
-            LIMIT ? OFFSET ?
+        # JSON在SQLite中直接生成，Python只处理一个字符串；同时取出末行作为下一页游标
+        query = f'''
+            SELECT COALESCE(json_group_array(json_object(
+                'id', id, 'content', content, 'content_type', content_type,
+                'likes_count', likes_count, 'retweets_count', retweets_count,
+                'replies_count', replies_count, 'created_at', created_at,
+                'collected_at', collected_at, 'author_name', author_name,
+                'author_handle', author_handle
+            )), '[]'),
+            COUNT(*),
+            json_extract(json_group_array(json_array(created_at, id)), '$[#-1]')
+            FROM (
+                SELECT c.id, c.content, c.content_type, c.likes_count, c.retweets_count,
+                       c.replies_count, c.created_at, c.collected_at,
+                       COALESCE(NULLIF(r.name, ''), 'Unknown') AS author_name,
+                       COALESCE(NULLIF(r.x_account, ''), '@unknown') AS author_handle
+                FROM x_content c
+                JOIN researchers r ON c.researcher_id = r.id
+                {where_clause}
+                ORDER BY c.created_at DESC, c.id DESC
+                LIMIT ? OFFSET ?
+            )
         '''
 
-        cursor.execute(query, (per_page, offset))
-        content_list = []
+        cursor.execute(query, tuple(params) + (per_page, offset))
+        content_json, row_count, last_key = cursor.fetchone()
+        content_json = content_json.encode('utf-8')
 
-        for row in cursor.fetchall():
-            content_list.append({
-                'id': row[0],
-                'content': row[1],
-                'content_type': row[2],
-                'likes_count': row[3],
-                'retweets_count': row[4],
-                'replies_count': row[5],
-                'created_at': row[6],
-                'collected_at': row[7],
-                'author_name': row[8] or 'Unknown',
-                'author_handle': row[9] or '@unknown'
-            })
+        next_cursor = None
+        if row_count == per_page and last_key:
+            last_time, last_id = orjson.loads(last_key)
+            if last_time is not None:
+                next_cursor = {'cursor': last_time, 'cursor_id': last_id}
 
-        conn.close()
+        if keyset:
+            return json_response(b'{"content":' + content_json + b',"next_cursor":' + orjson.dumps(next_cursor) + b'}')
 
-        # 如果是简单请求（无分页参数），返回简单格式
+        # 如果是简单请求（无分页参数），返回简单格式，无需统计总数
         if page == 1 and per_page == 20:
-            return jsonify(content_list)
+            return json_response(content_json)
 
-        return jsonify({
-            'content': content_list,
-            'pagination': {
-                'page': page,
-                'per_page': per_page,
-                'total': total_count,
-                'pages': (total_count + per_page - 1) // per_page
-            }
+        cursor.execute(f'SELECT COUNT(*) FROM x_content c {filter_clause}', filter_params)
+        total_count = cursor.fetchone()[0]
+
+        pagination = orjson.dumps({
+            'page': page,
+            'per_page': per_page,
+            'total': total_count,
+            'pages': (total_count + per_page - 1) // per_page
         })
+        return json_response(
+            b'{"content":' + content_json + b',"pagination":' + pagination
+            + b',"next_cursor":' + orjson.dumps(next_cursor) + b'}'
+        )
 
     except Exception as e:
         logger.error(f"获取内容列表失败: {e}")
-        conn.close()
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/start_monitoring', methods=['POST'])
 def start_monitoring_route():
     """开始监控指定研究者 - 支持批量操作"""
-    data = request.get_json()
+    data = json_body()
+    if data is None:
+        return jsonify({'error': 'Invalid JSON body'}), 400
     researcher_ids = data.get('researcher_ids', [])
 
     if not researcher_ids:
@@ -903,41 +1695,49 @@ def start_monitoring_route():
     if len(researcher_ids) > 1000:  # 单次最多1000个
         return jsonify({'error': 'Too many researchers selected at once (max: 1000)'}), 400
 
-    conn = sqlite3.connect('research_platform.db')
+    conn = get_db()
     cursor = conn.cursor()
 
-    success_count = 0
+    # ID列表作为一个JSON参数传入，避免逐条执行和SQLite变量数上限
+    ids_json = orjson.dumps(researcher_ids)
     failed_ids = []
 
     # 开始事务
     cursor.execute('BEGIN TRANSACTION')
 
     try:
-        for researcher_id in researcher_ids:
-            try:
-                # 更新研究者监控状态
-                cursor.execute('UPDATE researchers SET is_monitoring = 1, updated_at = CURRENT_TIMESTAMP WHERE id = ?', (researcher_id,))
-
-                # 创建监控任务
-                cursor.execute('INSERT OR REPLACE INTO monitoring_tasks (researcher_id, status, last_check) VALUES (?, \'active\', CURRENT_TIMESTAMP)', (researcher_id,))
+        # 更新研究者监控状态
+        cursor.execute('''
+            UPDATE researchers SET is_monitoring = 1, updated_at = CURRENT_TIMESTAMP
+            WHERE id IN (SELECT value FROM json_each(?))
+        ''', (ids_json,))
+        success_count = cursor.rowcount
 
-                success_count += 1
+        # 创建监控任务 - next_check_at留空，监控线程唤醒后立即检查
+        cursor.execute('''
+            INSERT INTO monitoring_tasks (researcher_id, status, last_check, next_check_at)
+            SELECT id, 'active', NULL, NULL FROM researchers
+            WHERE id IN (SELECT value FROM json_each(?))
+            ON CONFLICT(researcher_id) DO UPDATE SET status = 'active', last_check = NULL, next_check_at = NULL
+        ''', (ids_json,))
 
-            except Exception as e:
-                logger.error(f"启动监控研究者 {researcher_id} 失败: {e}")
-                failed_ids.append(researcher_id)
+        if success_count < len(researcher_ids):
+            cursor.execute('''
+                SELECT value FROM json_each(?)
+                WHERE NOT EXISTS (SELECT 1 FROM researchers WHERE id = value)
+            ''', (ids_json,))
+            failed_ids = [row[0] for row in cursor.fetchall()]
+            logger.warning(f"⚠️ {len(failed_ids)} 位研究者不存在，已跳过")
 
         cursor.execute('COMMIT')
+        invalidate_caches()
 
     except Exception as e:
         cursor.execute('ROLLBACK')
         logger.error(f"批量启动监控失败: {e}")
         return jsonify({'error': 'Failed to start monitoring'}), 500
 
-    finally:
-        conn.close()
-
-    # 确保监控服务正在运行
+    # 确保监控服务正在运行，已运行时唤醒以检查新增研究者
     if monitoring_service:
         monitoring_service.start_monitoring()
 
@@ -955,72 +1755,67 @@ def start_monitoring_route():
 @app.route('/api/stop_monitoring', methods=['POST'])
 def stop_monitoring_route():
     """停止监控指定研究者"""
-    data = request.get_json()
+    data = json_body()
+    if data is None:
+        return jsonify({'error': 'Invalid JSON body'}), 400
     researcher_ids = data.get('researcher_ids', [])
 
     if len(researcher_ids) > 1000:
         return jsonify({'error': 'Too many researchers selected at once (max: 1000)'}), 400
 
-    conn = sqlite3.connect('research_platform.db')
+    conn = get_db()
     cursor = conn.cursor()
 
     cursor.execute('BEGIN TRANSACTION')
 
     try:
-        for researcher_id in researcher_ids:
-            cursor.execute('UPDATE researchers SET is_monitoring = 0, updated_at = CURRENT_TIMESTAMP WHERE id = ?', (researcher_id,))
-            cursor.execute('UPDATE monitoring_tasks SET status = \'inactive\' WHERE researcher_id = ?', (researcher_id,))
+        ids_json = orjson.dumps(researcher_ids)
+        cursor.execute('''
+            UPDATE researchers SET is_monitoring = 0, updated_at = CURRENT_TIMESTAMP
+            WHERE id IN (SELECT value FROM json_each(?))
+        ''', (ids_json,))
+        cursor.execute('''
+            UPDATE monitoring_tasks SET status = 'inactive'
+            WHERE researcher_id IN (SELECT value FROM json_each(?))
+        ''', (ids_json,))
 
         cursor.execute('COMMIT')
+        invalidate_caches()
 
     except Exception as e:
         cursor.execute('ROLLBACK')
         logger.error(f"批量停止监控失败: {e}")
         return jsonify({'error': 'Failed to stop monitoring'}), 500
 
-    finally:
-        conn.close()
-
     return jsonify({'message': f'已停止监控 {len(researcher_ids)} 位研究者'})
 
 @app.route('/api/fetch_content/<int:researcher_id>', methods=['POST'])
 def fetch_researcher_content(researcher_id):
     """立即获取指定研究者的最新内容"""
-    conn = sqlite3.connect('research_platform.db')
+    conn = get_db()
     cursor = conn.cursor()
 
-    cursor.execute('SELECT name, x_account FROM researchers WHERE id = ?', (researcher_id,))
+    cursor.execute('SELECT name, x_account, twitter_user_id FROM researchers WHERE id = ?', (researcher_id,))
     researcher = cursor.fetchone()
 
     if not researcher:
-        conn.close()
         return jsonify({'error': 'Researcher not found'}), 404
 
-    name, x_account = researcher
+    name, x_account, twitter_user_id = researcher
 
     try:
         # 获取最新推文
-        tweets = twitter_api.get_user_tweets(x_account, max_results=10) if twitter_api else []
+        tweets = twitter_api.get_user_tweets(x_account, max_results=10, user_id=twitter_user_id) if twitter_api else []
 
         new_content_count = 0
         if tweets:
-            for tweet in tweets:
-                cursor.execute('''
-                    INSERT OR IGNORE INTO x_content
-                    (researcher_id, tweet_id, content, likes_count, retweets_count, replies_count, created_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    researcher_id, tweet['id'], tweet['content'],
-                    tweet['likes'], tweet['retweets'], tweet['replies'],
-                    tweet['created_at']
-                ))
-
-                if cursor.rowcount > 0:
-                    new_content_count += 1
-
-            conn.commit()
-
-        conn.close()
+            with conn:
+                new_content_count = insert_content_batch(cursor, tweet_rows(researcher_id, tweets))
+                if not twitter_user_id:
+                    cursor.execute(UPDATE_TWITTER_USER_ID_SQL,
+                                   (twitter_api.cached_user_id(x_account), researcher_id))
+            if new_content_count > 0:
+                invalidate_caches()
 
         message = f'成功获取 {name} 的内容。' if tweets else f'未找到 {name} 的新内容。'
         return jsonify({
@@ -1030,7 +1825,6 @@ def fetch_researcher_content(researcher_id):
         })
 
     except Exception as e:
-        conn.close()
         logger.error(f"获取 {name} 内容失败: {e}")
         return jsonify({'error': str(e)}), 500
 
@@ -1038,7 +1832,7 @@ def fetch_researcher_content(researcher_id):
 def get_monitoring_settings():
     """获取监控设置"""
     try:
-        conn = sqlite3.connect('research_platform.db')
+        conn = get_db()
         cursor = conn.cursor()
 
         cursor.execute('SELECT setting_key, setting_value, description FROM system_settings')
@@ -1049,8 +1843,6 @@ def get_monitoring_settings():
                 'description': row[2]
             }
 
-        conn.close()
-
         # 计算当前间隔的人性化显示
         interval_seconds = int(settings.get('monitoring_interval', {}).get('value', 1800))
         interval_display = format_interval(interval_seconds)
@@ -1077,7 +1869,9 @@ def get_monitoring_settings():
 def update_monitoring_settings():
     """更新监控设置"""
     try:
-        data = request.get_json()
+        data = json_body()
+        if data is None:
+            return jsonify({'error': 'Invalid JSON body'}), 400
         interval_seconds = data.get('monitoring_interval')
 
         if not interval_seconds or not isinstance(interval_seconds, int):
@@ -1105,30 +1899,37 @@ def update_monitoring_settings():
 
 @app.route('/api/analytics')
 def get_analytics():
-    """获取平台分析数据"""
-    conn = sqlite3.connect('research_platform.db')
-    cursor = conn.cursor()
-
-    # 基础统计
-    cursor.execute('SELECT COUNT(*) FROM researchers')
-    total_researchers = cursor.fetchone()[0]
-
-    cursor.execute('SELECT COUNT(*) FROM researchers WHERE is_monitoring = 1')
-    monitoring_researchers = cursor.fetchone()[0]
-
-    cursor.execute('SELECT COUNT(*) FROM x_content')
-    total_content = cursor.fetchone()[0]
+    """获取平台分析数据 - 结果缓存60秒，数据写入时失效"""
+    cached_body = analytics_cache.get('analytics')
+    if cached_body is not None:
+        return json_response(cached_body)
 
-    cursor.execute('SELECT SUM(likes_count + retweets_count + replies_count) FROM x_content')
-    total_engagement = cursor.fetchone()[0] or 0
+    conn = get_db()
+    cursor = conn.cursor()
 
-    # 国家分布
-    cursor.execute('SELECT country, COUNT(*) FROM researchers GROUP BY country')
-    country_distribution = {k: v for k, v in cursor.fetchall() if k}
+    # 基础统计与监控间隔 - 单次查询；各项总数由触发器维护
+    cursor.execute('''
+        SELECT t.total_researchers, t.monitoring_researchers, t.total_content, t.total_engagement,
+               (SELECT setting_value FROM system_settings WHERE setting_key = 'monitoring_interval')
+        FROM analytics_totals t WHERE t.id = 1
+    ''')
+    (total_researchers, monitoring_researchers, total_content,
+     total_engagement, interval_setting) = cursor.fetchone()
 
-    # 公司分布
-    cursor.execute('SELECT company, COUNT(*) FROM researchers GROUP BY company')
-    company_distribution = {k: v for k, v in cursor.fetchall() if k}
+    # 国家、公司分布 - 单次查询
+    cursor.execute('''
+        SELECT 'country', country, COUNT(*) FROM researchers GROUP BY country
+        UNION ALL
+        SELECT 'company', company, COUNT(*) FROM researchers GROUP BY company
+    ''')
+    country_distribution = {}
+    company_distribution = {}
+    for kind, key, count in cursor.fetchall():
+        if key:
+            if kind == 'country':
+                country_distribution[key] = count
+            else:
+                company_distribution[key] = count
 
     # 最近7天的内容趋势
     cursor.execute('''
@@ -1141,25 +1942,19 @@ def get_analytics():
     content_trend = dict(cursor.fetchall())
 
     # 监控能力状态
-    cursor.execute('SELECT MAX(rank) FROM researchers')
     max_capacity = 5000  # 最大支持容量
-    current_capacity = cursor.fetchone()[0] or 0
 
-    # 获取监控间隔设置
+    # 监控间隔设置
     monitoring_interval = 1800  # 默认值
     interval_display = "30分钟"
     try:
-        cursor.execute('SELECT setting_value FROM system_settings WHERE setting_key = ?', ('monitoring_interval',))
-        result = cursor.fetchone()
-        if result:
-            monitoring_interval = int(result[0])
+        if interval_setting:
+            monitoring_interval = int(interval_setting)
             interval_display = format_interval(monitoring_interval)
     except Exception as e:
         logger.error(f"获取监控间隔设置失败: {e}")
 
-    conn.close()
-
-    return jsonify({
+    body = orjson.dumps({
         'total_researchers': total_researchers,
         'monitoring_researchers': monitoring_researchers,
         'total_content': total_content,
@@ -1177,7 +1972,10 @@ def get_analytics():
             'max_supported': max_capacity,
             'utilization': f"{(total_researchers/max_capacity)*100:.1f}%"
         }
-    })
+    }, option=OrjsonProvider.option)
+    analytics_cache.set('analytics', body)
+
+    return json_response(body)
 
 @app.route('/api/upload_excel', methods=['POST'])
 def upload_excel():
@@ -1193,29 +1991,39 @@ def upload_excel():
     if not file.filename.lower().endswith(('.xlsx', '.xls')):
         return jsonify({'error': 'Please upload an Excel file (.xlsx or .xls)'}), 400
 
+    workbook = None
     try:
         import openpyxl
-        workbook = openpyxl.load_workbook(file)
+        # 只读流式解析，不构建完整的单元格对象树
+        workbook = openpyxl.load_workbook(file, read_only=True, data_only=True)
         worksheet = workbook.active
 
-        logger.info(f"📊 开始处理Excel文件，共 {worksheet.max_row - 1} 行数据")
+        logger.info("📊 开始处理Excel文件")
 
-        conn = sqlite3.connect('research_platform.db')
+        conn = get_db()
         cursor = conn.cursor()
 
-        # 开始事务
-        cursor.execute('BEGIN TRANSACTION')
+        # 开始事务 - 立即获取写锁，整个导入只提交一次
+        cursor.execute('BEGIN IMMEDIATE')
+
+        # 大文件导入时先删除二级索引，导入完成后一次性重建比逐行维护更快
+        # 索引删除在事务内进行，导入失败回滚时索引随之恢复
+        bulk_import = (worksheet.max_row or 0) > BULK_IMPORT_MIN_ROWS
+        if bulk_import:
+            drop_researcher_indexes(cursor)
 
         added_count = 0
         error_count = 0
         skipped_count = 0
+        total_processed = 0
         error_details = []
 
         # 批量处理数据
-        batch_size = 100
+        batch_size = 1000
         batch_data = []
 
         for row_num, row in enumerate(worksheet.iter_rows(min_row=2, values_only=True), start=2):
+            total_processed += 1
             try:
                 # 数据验证
                 if not row or len(row) < 6:
@@ -1261,11 +2069,13 @@ def upload_excel():
         if batch_data:
             added_count += insert_researcher_batch(cursor, batch_data, error_details)
 
+        if bulk_import:
+            create_researcher_indexes(cursor)
+            cursor.execute('ANALYZE researchers;')  # 大量新数据后刷新查询规划统计信息
+
         # 提交事务
         cursor.execute('COMMIT')
-        conn.close()
-
-        total_processed = worksheet.max_row - 1
+        invalidate_caches()
 
         logger.info(f"✅ Excel导入完成: 成功 {added_count}, 跳过 {skipped_count}, 错误 {error_count}")
 
@@ -1288,19 +2098,24 @@ def upload_excel():
             'error': f'文件处理失败: {str(e)}',
             'suggestion': '请检查文件格式，确保包含必要的列：排名、姓名、国家、公司、研究领域、X账号'
         }), 500
+    finally:
+        if workbook is not None:
+            workbook.close()
 
 @app.route('/api/special_focus', methods=['POST'])
 def set_special_focus():
     """设置特别关注"""
     try:
-        data = request.get_json()
+        data = json_body()
+        if data is None:
+            return jsonify({'error': 'Invalid JSON body'}), 400
         researcher_ids = data.get('researcher_ids', [])
         is_special = data.get('is_special', True)
 
         if not researcher_ids:
             return jsonify({'error': 'No researchers selected'}), 400
 
-        conn = sqlite3.connect('research_platform.db')
+        conn = get_db()
         cursor = conn.cursor()
 
         success_count = 0
@@ -1313,7 +2128,7 @@ def set_special_focus():
             success_count += 1
 
         conn.commit()
-        conn.close()
+        invalidate_caches()
 
         action = "设为特别关注" if is_special else "取消特别关注"
         return jsonify({
@@ -1329,28 +2144,18 @@ def set_special_focus():
 def get_special_focus():
     """获取特别关注的研究者列表"""
     try:
-        conn = sqlite3.connect('research_platform.db')
+        conn = get_db()
         cursor = conn.cursor()
 
-        cursor.execute('''
-            SELECT id, rank, name, country, company, research_focus, x_account,
-                   followers_count, following_count, avatar_url, is_monitoring, is_special_focus
+        cursor.execute(f'''
+            SELECT {RESEARCHER_COLUMNS}
             FROM researchers
             WHERE is_special_focus = 1
             ORDER BY name
         ''')
 
-        researchers = []
-        for row in cursor.fetchall():
-            researchers.append({
-                'id': row[0], 'rank': row[1], 'name': row[2], 'country': row[3],
-                'company': row[4], 'research_focus': row[5], 'x_account': row[6],
-                'followers_count': row[7], 'following_count': row[8],
-                'avatar_url': row[9], 'is_monitoring': bool(row[10]),
-                'is_special_focus': bool(row[11])
-            })
+        researchers = [researcher_dict(row) for row in cursor.fetchall()]
 
-        conn.close()
         logger.info(f"获取特别关注列表成功，共 {len(researchers)} 位")
         return jsonify(researchers)
 
@@ -1362,14 +2167,13 @@ def get_special_focus():
 def update_user_info(researcher_id):
     """更新研究者的用户信息（关注者等数据）"""
     try:
-        conn = sqlite3.connect('research_platform.db')
+        conn = get_db()
         cursor = conn.cursor()
 
         cursor.execute('SELECT name, x_account FROM researchers WHERE id = ?', (researcher_id,))
         researcher = cursor.fetchone()
 
         if not researcher:
-            conn.close()
             return jsonify({'error': 'Researcher not found'}), 404
 
         name, x_account = researcher
@@ -1381,19 +2185,18 @@ def update_user_info(researcher_id):
             # 更新数据库中的用户信息 - 直接存储数字而不是格式化字符串
             cursor.execute('''
                 UPDATE researchers
-                SET followers_count = ?, following_count = ?, updated_at = CURRENT_TIMESTAMP
+                SET followers_count = ?, following_count = ?, twitter_user_id = ?, updated_at = CURRENT_TIMESTAMP
                 WHERE id = ?
-            ''', (str(user_info['followers_count']), str(user_info['following_count']), researcher_id))
+            ''', (user_info['followers_count'], user_info['following_count'], user_info['id'], researcher_id))
 
             conn.commit()
-            conn.close()
+            invalidate_caches()
 
             return jsonify({
                 'message': f'成功更新 {name} 的用户信息',
                 'user_info': user_info
             })
         else:
-            conn.close()
             return jsonify({
                 'message': f'无法获取 {name} 的用户信息（可能是API限制或网络问题）',
                 'user_info': None
@@ -1407,43 +2210,37 @@ def update_user_info(researcher_id):
 def update_all_user_info():
     """批量更新所有研究者的用户信息"""
     try:
-        conn = sqlite3.connect('research_platform.db')
+        conn = get_db()
         cursor = conn.cursor()
 
         cursor.execute('SELECT id, name, x_account FROM researchers ORDER BY id')
         researchers = cursor.fetchall()
 
-        updated_count = 0
-        failed_count = 0
+        # 每次API请求查询100位用户，代替逐个查询并等待
+        users_info = twitter_api.get_users_info_bulk(
+            [x_account for _, _, x_account in researchers if x_account]
+        ) if twitter_api else {}
 
+        update_rows = []
         for researcher_id, name, x_account in researchers:
-            try:
-                # 获取用户信息
-                user_info = twitter_api.get_user_info(x_account) if twitter_api else None
-
-                if user_info:
-                    # 更新数据库
-                    cursor.execute('''
-                        UPDATE researchers
-                        SET followers_count = ?, following_count = ?, updated_at = CURRENT_TIMESTAMP
-                        WHERE id = ?
-                    ''', (str(user_info['followers_count']), str(user_info['following_count']), researcher_id))
-
-                    updated_count += 1
-                    logger.info(f"✅ 更新 {name}: {user_info['followers_count']} 关注者, {user_info['following_count']} 正在关注")
-                else:
-                    failed_count += 1
-                    logger.warning(f"⚠️ 无法获取 {name} 的用户信息")
-
-                # 添加延迟，避免API限制
-                time.sleep(2)  # 增加延迟到2秒
+            user_info = users_info.get((x_account or '').replace('@', '').strip().lower())
+            if user_info:
+                update_rows.append((user_info['followers_count'], user_info['following_count'],
+                                    user_info['id'], researcher_id))
+            else:
+                logger.warning(f"⚠️ 无法获取 {name} 的用户信息")
 
-            except Exception as e:
-                failed_count += 1
-                logger.error(f"❌ 更新 {name} 失败: {e}")
+        with conn:
+            cursor.executemany('''
+                UPDATE researchers
+                SET followers_count = ?, following_count = ?, twitter_user_id = ?, updated_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            ''', update_rows)
+        invalidate_caches()
 
-        conn.commit()
-        conn.close()
+        updated_count = len(update_rows)
+        failed_count = len(researchers) - updated_count
+        logger.info(f"✅ 批量更新用户信息: 成功 {updated_count} 个，失败 {failed_count} 个")
 
         return jsonify({
             'message': f'批量更新完成: 成功 {updated_count} 个，失败 {failed_count} 个',
@@ -1455,41 +2252,63 @@ def update_all_user_info():
         logger.error(f"批量更新用户信息失败: {e}")
         return jsonify({'error': str(e)}), 500
 
+# 健康检查响应体按（时间戳秒, 各项状态）缓存，状态未变时直接返回已序列化的字节
+health_cache = (None, b'')
+
 @app.route('/health')
 def health_check():
     """健康检查"""
-    return jsonify({
-        'status': 'healthy' if researcher_manager else 'partial',
-        'timestamp': datetime.now().isoformat(),
-        'twitter_api': 'connected' if twitter_api and hasattr(twitter_api, 'client') and twitter_api.client else 'disconnected',
-        'twitter_working': twitter_api and twitter_api.api_working if twitter_api else False,
-        'monitoring': 'active' if monitoring_service and monitoring_service.running else 'inactive',
-        'capacity': '5000 researchers supported',
-        'components': {
-            'researcher_manager': 'ok' if researcher_manager else 'failed',
-            'twitter_api': 'ok' if twitter_api else 'failed',
-            'monitoring_service': 'ok' if monitoring_service else 'failed'
-        }
-    })
+    global health_cache
+    state = (
+        iso_now(),
+        'connected' if twitter_api and hasattr(twitter_api, 'client') and twitter_api.client else 'disconnected',
+        twitter_api and twitter_api.api_working if twitter_api else False,
+        'active' if monitoring_service and monitoring_service.running else 'inactive'
+    )
+    cached_state, body = health_cache
+    if state != cached_state:
+        timestamp, twitter_status, twitter_working, monitoring_status = state
+        body = orjson.dumps({
+            'status': 'healthy' if researcher_manager else 'partial',
+            'timestamp': timestamp,
+            'twitter_api': twitter_status,
+            'twitter_working': twitter_working,
+            'monitoring': monitoring_status,
+            'capacity': '5000 researchers supported',
+            'components': component_status
+        })
+        health_cache = (state, body)
+    return json_response(body)
+
+@app.route('/metrics')
+def metrics():
+    """Prometheus文本格式指标 - 读取触发器维护的汇总行，抓取时不做计数扫描"""
+    total_researchers, monitoring_researchers, total_content, total_engagement = get_db().execute('''
+        SELECT total_researchers, monitoring_researchers, total_content, total_engagement
+        FROM analytics_totals WHERE id = 1
+    ''').fetchone()
+
+    gauges = (
+        ('researchers_total', total_researchers),
+        ('researchers_monitoring', monitoring_researchers),
+        ('content_total', total_content),
+        ('content_engagement_total', total_engagement),
+        ('monitoring_service_running', int(bool(monitoring_service and monitoring_service.running))),
+        ('twitter_rate_limited', int(bool(twitter_api and twitter_api.is_rate_limited()))),
+    )
+    body = ''.join(f'# TYPE {name} gauge\n{name} {value}\n' for name, value in gauges)
+    return app.response_class(body, mimetype='text/plain; version=0.0.4')
 
 @app.route('/api/init_status')
 def get_init_status():
-    """获取初始化状态"""
-    return jsonify({
-        'initialized': bool(researcher_manager),
-        'components': {
-            'database': bool(researcher_manager),
-            'twitter_api': bool(twitter_api),
-            'monitoring': bool(monitoring_service)
-        },
-        'ready': bool(researcher_manager and twitter_api and monitoring_service)
-    })
+    """获取初始化状态 - 响应体在初始化时生成"""
+    return json_response(init_status_body)
 
 @app.route('/api/database_status')
 def get_database_status():
     """获取数据库状态信息"""
     try:
-        conn = sqlite3.connect('research_platform.db')
+        conn = get_db()
         cursor = conn.cursor()
 
         # 检查各表的记录数
@@ -1504,17 +2323,15 @@ def get_database_status():
 
         # 检查数据库文件大小
         import os
-        db_size = os.path.getsize('research_platform.db') if os.path.exists('research_platform.db') else 0
+        db_size = os.path.getsize(DB_FILE) if os.path.exists(DB_FILE) else 0
 
         # 检查初始化状态
         cursor.execute('SELECT value FROM db_metadata WHERE key = ?', ('sample_data_loaded',))
         initialized = cursor.fetchone()
 
-        conn.close()
-
         return jsonify({
-            'database_file': 'research_platform.db',
-            'file_exists': os.path.exists('research_platform.db'),
+            'database_file': DB_FILE,
+            'file_exists': os.path.exists(DB_FILE),
             'file_size_bytes': db_size,
             'file_size_mb': round(db_size / 1024 / 1024, 2),
             'tables': {
@@ -1532,40 +2349,28 @@ def get_database_status():
 
 @app.route('/api/system_status')
 def get_system_status():
-    """获取系统状态信息"""
-    conn = sqlite3.connect('research_platform.db')
-    cursor = conn.cursor()
-
-    # 数据库统计
-    cursor.execute('SELECT COUNT(*) FROM researchers')
-    total_researchers = cursor.fetchone()[0]
-
-    cursor.execute('SELECT COUNT(*) FROM researchers WHERE is_monitoring = 1')
-    monitoring_count = cursor.fetchone()[0]
-
-    cursor.execute('SELECT COUNT(*) FROM x_content')
-    total_content = cursor.fetchone()[0]
-
-    # 最近24小时的活动
-    cursor.execute('''
-        SELECT COUNT(*) FROM x_content
-        WHERE collected_at >= datetime('now', '-1 day')
-    ''')
-    recent_content = cursor.fetchone()[0]
+    """获取系统状态信息 - 结果缓存5秒，数据写入时失效"""
+    cached_body = status_cache.get('status')
+    if cached_body is not None:
+        return json_response(cached_body)
+
+    # 数据库统计 - 单次查询；总数读取触发器维护的计数，仅近24小时数走索引统计
+    total_researchers, monitoring_count, total_content, recent_content, interval_setting = get_db().execute('''
+        SELECT t.total_researchers, t.monitoring_researchers, t.total_content,
+               (SELECT COUNT(*) FROM x_content WHERE collected_at >= datetime('now', '-1 day')),
+               (SELECT setting_value FROM system_settings WHERE setting_key = 'monitoring_interval')
+        FROM analytics_totals t WHERE t.id = 1
+    ''').fetchone()
 
     # 获取监控间隔
     monitoring_interval = 1800
     try:
-        cursor.execute('SELECT setting_value FROM system_settings WHERE setting_key = ?', ('monitoring_interval',))
-        result = cursor.fetchone()
-        if result:
-            monitoring_interval = int(result[0])
+        if interval_setting:
+            monitoring_interval = int(interval_setting)
     except Exception as e:
         logger.error(f"获取监控间隔失败: {e}")
 
-    conn.close()
-
-    return jsonify({
+    body = orjson.dumps({
         'system_capacity': {
             'max_researchers': 5000,
             'current_researchers': total_researchers,
@@ -1586,16 +2391,19 @@ def get_system_status():
         'api_status': {
             'twitter_connected': twitter_api and hasattr(twitter_api, 'client') and twitter_api.client is not None,
             'twitter_working': twitter_api and twitter_api.api_working,
-            'last_check': datetime.now().isoformat()
+            'last_check': iso_now()
         }
-    })
+    }, option=OrjsonProvider.option)
+    status_cache.set('status', body)
+
+    return json_response(body)
 
 @app.route('/api/reset_sample_data', methods=['POST'])
 def reset_sample_data():
     """重置示例数据（仅用于测试和恢复）"""
     try:
         if researcher_manager:
-            conn = sqlite3.connect('research_platform.db')
+            conn = get_db()
             cursor = conn.cursor()
 
             # 删除现有示例数据（基于名字判断）
@@ -1607,10 +2415,10 @@ def reset_sample_data():
             cursor.execute('DELETE FROM db_metadata WHERE key = ?', ('sample_data_loaded',))
 
             conn.commit()
-            conn.close()
 
             # 重新加载示例数据
             researcher_manager.load_sample_data_if_empty()
+            invalidate_caches()
 
             return jsonify({'message': '示例数据已重置', 'status': 'success'})
         else:
@@ -1625,7 +2433,7 @@ def reset_sample_data():
 def test_twitter_simple():
     """简单的Twitter API测试"""
     try:
-        data = request.get_json() or {}
+        data = json_body() or {}
         username = data.get('username', 'karpathy')
 
         if not twitter_api:
@@ -1693,17 +2501,16 @@ def debug_twitter_status():
 if __name__ == '__main__':
     logger.info("🚀 AI研究者X内容学习平台启动中...")
     logger.info(f"📊 系统容量: 最大支持 5000 位研究者监控")
-    logger.info(f"💾 数据库文件: research_platform.db")
+    logger.info(f"💾 数据库文件: {DB_FILE}")
+
+    init_app_state()
 
     # 检查数据库状态
     if researcher_manager:
         import os
-        if os.path.exists('research_platform.db'):
-            conn = sqlite3.connect('research_platform.db')
-            cursor = conn.cursor()
-            cursor.execute('SELECT COUNT(*) FROM researchers')
-            count = cursor.fetchone()[0]
-            conn.close()
+        if os.path.exists(DB_FILE):
+            with closing(connect_db()) as conn:
+                count = conn.execute('SELECT COUNT(*) FROM researchers').fetchone()[0]
             logger.info(f"📋 数据库状态: 已有 {count} 位研究者")
         else:
             logger.info("📋 数据库状态: 新建数据库")